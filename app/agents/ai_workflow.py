@@ -5,15 +5,32 @@ This module defines a sophisticated LangGraph workflow where an AI agent
 makes  decisions about how to analyze a pull request.
 """
 
-from typing import Any, Dict, List, Optional, TypedDict
+import asyncio
+import heapq
+from collections import Counter
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    TypedDict,
+)
 
 from langgraph.graph import END, StateGraph
 
 from app.agents.tools.ai_tools import analyze_code_with_ai
+from app.config.settings import get_settings
 from app.services.llm_service import LLMService
 from app.utils.logger import logger
 
 
+# Called with (file_path, formatted file result) as soon as a file is analyzed
+FileResultCallback = Callable[[str, Dict[str, Any]], Awaitable[None]]
+
+
 class FileAnalysis(TypedDict):
     """Represents the analysis results for a single file."""
 
@@ -33,6 +50,36 @@ class AIAnalysisState(TypedDict):
     analysis_results: List[FileAnalysis]
     final_summary: Dict[str, Any]
     llm_service: LLMService
+    on_file_analyzed: Optional[FileResultCallback]
+
+
+def balance_by_weight(
+    items: Sequence[Any], weights: Sequence[int], workers: int
+) -> List[List[Any]]:
+    """
+    Split items into at most `workers` queues with roughly equal total weight.
+
+    Uses longest-processing-time-first scheduling: heaviest items first, each
+    assigned to the currently lightest queue.
+
+    Args:
+        items: Items to distribute
+        weights: Weight of each item (e.g. token count)
+        workers: Number of queues to fill
+
+    Returns:
+        A list of non-empty queues
+    """
+    workers = max(1, min(workers, len(items)))
+    queues: List[List[Any]] = [[] for _ in range(workers)]
+    heap = [(0, index) for index in range(workers)]
+
+    for position in sorted(range(len(items)), key=weights.__getitem__, reverse=True):
+        load, index = heapq.heappop(heap)
+        queues[index].append(items[position])
+        heapq.heappush(heap, (load + weights[position], index))
+
+    return [queue for queue in queues if queue]
 
 
 class AIWorkflow:
@@ -41,6 +88,7 @@ class AIWorkflow:
     """
 
     def __init__(self):
+        self.settings = get_settings()
         self.graph = self._build_graph()
         logger.info("AI Agent analysis workflow initialized")
 
@@ -71,10 +119,19 @@ class AIWorkflow:
         return workflow.compile()
 
     async def run(
-        self, pr_data: Dict[str, Any], files_data: List[Dict[str, Any]]
+        self,
+        pr_data: Dict[str, Any],
+        files_data: List[Dict[str, Any]],
+        on_file_analyzed: Optional[FileResultCallback] = None,
     ) -> Dict[str, Any]:
         """
         Run the intelligent analysis workflow.
+
+        Args:
+            pr_data: Pull request metadata
+            files_data: Changed files with content
+            on_file_analyzed: Optional coroutine receiving each file's result
+                as soon as it is ready, in completion order
         """
         llm_service = LLMService()
 
@@ -86,6 +143,7 @@ class AIWorkflow:
             "analysis_results": [],
             "final_summary": {},
             "llm_service": llm_service,
+            "on_file_analyzed": on_file_analyzed,
         }
         final_state = await self.graph.ainvoke(initial_state)
         return self._format_output(final_state)
@@ -108,29 +166,79 @@ class AIWorkflow:
 
     async def file_analysis_loop_node(self, state: AIAnalysisState) -> AIAnalysisState:
         """
-        Analyzes one file at a time, decided by the agent's strategy.
+        Analyzes the critical files concurrently.
+
+        Files are spread over `max_concurrent_analyses` workers balanced by
+        token count, so one large file does not hold up the rest.
         """
         if not state["critical_files"]:
             return state
 
-        file_path = state["critical_files"].pop(0)
-        state["current_file_path"] = file_path
+        files_by_path = {f.get("filename"): f for f in state["files_data"]}
+        pending = []
+        while state["critical_files"]:
+            file_path = state["critical_files"].pop(0)
+            file_data = files_by_path.get(file_path)
+            if not file_data or not file_data.get("content"):
+                logger.warning(
+                    f"No content found for file {file_path}, skipping analysis."
+                )
+                continue
+            pending.append(file_data)
 
-        file_data = next(
-            (f for f in state["files_data"] if f.get("filename") == file_path), None
-        )
-        if not file_data or not file_data.get("content"):
-            logger.warning(f"No content found for file {file_path}, skipping analysis.")
-            return state
-
-        logger.info(f"AI is analyzing file: {file_path}")
-        # AI performs a deep analysis using the AI tool
         llm_service = state["llm_service"]
-        issues = await analyze_code_with_ai(
-            llm_service, file_path, file_data["content"]
+        # Encode each file once: the tokens weigh the queues and are reused
+        # when the file is split into prompt chunks
+        tokens_by_path = {
+            f["filename"]: llm_service.encode(f["content"]) for f in pending
+        }
+        queues = balance_by_weight(
+            pending,
+            [
+                llm_service.count_tokens(f["content"], tokens_by_path[f["filename"]])
+                for f in pending
+            ],
+            self.settings.agent.max_concurrent_analyses,
         )
 
-        state["analysis_results"].append({"file_path": file_path, "issues": issues})
+        issues_by_path: Dict[str, List[Dict[str, Any]]] = {}
+        on_file_analyzed = state.get("on_file_analyzed")
+
+        async def analyze_queue(queue: List[Dict[str, Any]]) -> None:
+            for file_data in queue:
+                file_path = file_data["filename"]
+                state["current_file_path"] = file_path
+                logger.info(f"AI is analyzing file: {file_path}")
+                # AI performs a deep analysis using the AI tool
+                issues = await analyze_code_with_ai(
+                    llm_service,
+                    file_path,
+                    file_data["content"],
+                    tokens_by_path.pop(file_path),
+                )
+                issues_by_path[file_path] = issues
+                if on_file_analyzed:
+                    await on_file_analyzed(
+                        file_path, self._format_file(file_data, issues)
+                    )
+
+        tasks = [asyncio.create_task(analyze_queue(queue)) for queue in queues]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            # The worker's event loop outlives the task, so queues left running
+            # after a failure would keep reporting files for a failed analysis
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+        # Keep results in triage order regardless of completion order
+        for file_data in pending:
+            file_path = file_data["filename"]
+            state["analysis_results"].append(
+                {"file_path": file_path, "issues": issues_by_path[file_path]}
+            )
         return state
 
     def should_continue_analysis(self, state: AIAnalysisState) -> str:
@@ -147,19 +255,19 @@ class AIWorkflow:
         """
         logger.info("AI is synthesizing the final report.")
         analysis_results = state["analysis_results"]
-        total_issues = sum(len(res.get("issues", [])) for res in analysis_results)
         total_files = len(analysis_results)
 
-        severity_breakdown = {"critical": 0, "high": 0, "medium": 0, "low": 0}
-        type_breakdown = {}
+        issues = [
+            issue for result in analysis_results for issue in result.get("issues", [])
+        ]
+        total_issues = len(issues)
+        severity_counts = Counter(issue.get("severity", "low") for issue in issues)
+        type_breakdown = dict(Counter(issue.get("type", "style") for issue in issues))
 
-        for result in analysis_results:
-            for issue in result.get("issues", []):
-                severity = issue.get("severity", "low")
-                issue_type = issue.get("type", "style")
-                if severity in severity_breakdown:
-                    severity_breakdown[severity] += 1
-                type_breakdown[issue_type] = type_breakdown.get(issue_type, 0) + 1
+        severity_breakdown = {
+            severity: severity_counts[severity]
+            for severity in ("critical", "high", "medium", "low")
+        }
 
         summary = {
             "total_files_analyzed": total_files,
@@ -184,15 +292,25 @@ class AIWorkflow:
         formatted_files = {}
         for file_analysis in final_state.get("analysis_results", []):
             file_path = file_analysis["file_path"]
-            source = files_by_path.get(file_path, {})
-            content = source.get("content") or ""
-            formatted_files[file_path] = {
-                "language": source.get("language") or "unknown",
-                "size": len(content.encode("utf-8")),
-                "issues": file_analysis["issues"],
-            }
+            formatted_files[file_path] = self._format_file(
+                files_by_path.get(file_path, {}), file_analysis["issues"]
+            )
 
         return {
             "summary": final_state.get("final_summary", {}),
             "files": formatted_files,
         }
+
+    @staticmethod
+    def _format_file(
+        file_data: Dict[str, Any], issues: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Formats one file's analysis for database saving.
+        """
+        content = file_data.get("content") or ""
+        return {
+            "language": file_data.get("language") or "unknown",
+            "size": len(content.encode("utf-8")),
+            "issues": issues,
+        }
@@ -5,7 +5,7 @@ This module defines the tools that the intelligent AI agent can use to
 perform a deep, AI-driven analysis of code files.
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 
 from app.services.llm_service import LLMService
@@ -16,6 +16,7 @@ async def analyze_code_with_ai(
     llm_service: LLMService,
     file_path: str,
     code_content: str,
+    tokens: Optional[List[int]] = None,
 ) -> List[Dict[str, Any]]:
     """
     A tool that uses an AI model to analyze a code file for various issues.
@@ -24,6 +25,7 @@ async def analyze_code_with_ai(
         llm_service: An active instance of the LLMService.
         file_path: The path of the file to analyze.
         code_content: The actual content of the file.
+        tokens: The content already encoded by the LLM service, if available.
 
     Returns:
         A list of issues found by the AI model, validated against the required schema.
@@ -31,7 +33,9 @@ async def analyze_code_with_ai(
     analysis_type = "comprehensive"  # Defaulting to comprehensive for now
     logger.info(f"Executing AI-powered analysis for {file_path}")
     try:
-        issues = await llm_service.analyze_code(file_path, code_content, analysis_type)
+        issues = await llm_service.analyze_code(
+            file_path, code_content, analysis_type, tokens
+        )
         logger.info(
             f"AI analysis for {file_path} completed, found {len(issues)} issues."
         )
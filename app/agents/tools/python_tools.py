@@ -6,11 +6,16 @@ Each tool performs a specific type of analysis and returns structured results.
 """
 
 import ast
+import re
 from typing import Dict, Any, List
 from langchain_core.tools import tool
 
 from app.utils.logger import logger
 
+# Names that suggest a credential; matched anywhere in a line, so "api_key"
+# and "AUTH_TOKEN" are caught too
+_CREDENTIAL_RE = re.compile(r"password|secret|key|token", re.IGNORECASE)
+
 
 @tool
 def get_file_content_tool(file_path: str, commit_sha: str = None) -> Dict[str, Any]:
@@ -349,10 +354,7 @@ def best_practice_tool(file_content: str, file_path: str) -> List[Dict[str, Any]
     # Text-based checks
     for i, line in enumerate(lines, 1):
         # Check for hardcoded credentials/secrets
-        if any(
-            keyword in line.lower()
-            for keyword in ["password", "secret", "key", "token"]
-        ):
+        if _CREDENTIAL_RE.search(line):
             if "=" in line and any(quote in line for quote in ['"', "'"]):
                 issues.append(
                     {
@@ -7,20 +7,44 @@ Provides database engine setup, connection pooling, and utilities.
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator, Optional
 
-from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlmodel import SQLModel
 
 from app.config.settings import get_settings
 from app.utils.logger import logger
 
 
+def async_database_url(db_url: str) -> URL:
+    """
+    Point a PostgreSQL URL at the asyncpg driver.
+
+    Sync drivers (psycopg2, psycopg, ...) would run behind a greenlet adapter
+    and block the event loop, so any PostgreSQL driver is replaced.
+
+    Args:
+        db_url: Database URL from settings
+
+    Returns:
+        URL using postgresql+asyncpg, or the parsed URL for other backends
+    """
+    url = make_url(db_url)
+    if url.get_backend_name() in ("postgres", "postgresql"):
+        url = url.set(drivername="postgresql+asyncpg")
+    return url
+
+
 class DatabaseManager:
     """Database connection and session management"""
 
     def __init__(self):
         self.engine: Optional[AsyncEngine] = None
-        self.async_session_factory: Optional[sessionmaker] = None
+        self.async_session_factory: Optional[async_sessionmaker[AsyncSession]] = None
         self._initialized = False
 
     def initialize(self) -> None:
@@ -30,12 +54,8 @@ class DatabaseManager:
 
         settings = get_settings()
 
-        # Convert PostgreSQL URL to async version if needed
-        db_url = settings.database.url
-        if db_url.startswith("postgresql://"):
-            db_url = db_url.replace("postgresql://", "postgresql+asyncpg://", 1)
-        elif db_url.startswith("postgres://"):
-            db_url = db_url.replace("postgres://", "postgresql+asyncpg://", 1)
+        # Always talk to PostgreSQL through the async driver
+        db_url = async_database_url(settings.database.url)
 
         # Create async engine
         self.engine = create_async_engine(
@@ -46,14 +66,13 @@ class DatabaseManager:
             pool_timeout=30,
             pool_recycle=-1,
             pool_pre_ping=True,  # Validate connections before use
+            pool_use_lifo=True,  # Reuse hot connections; idle extras can time out
         )
 
         # Create async session factory
-        self.async_session_factory = sessionmaker(
+        self.async_session_factory = async_sessionmaker(
             bind=self.engine,
-            class_=AsyncSession,
             expire_on_commit=False,
-            autocommit=False,
             autoflush=False,
         )
 
@@ -42,6 +42,7 @@ class RedisConfig(BaseModel):
     """Redis configuration"""
 
     url: str
+    max_connections: int = 64  # Per client connection pool
 
 
 class CeleryConfig(BaseModel):
@@ -53,6 +54,7 @@ class CeleryConfig(BaseModel):
     task_soft_time_limit: int = 60 * 19  # 19 minutes
     worker_prefetch_multiplier: int = 1
     worker_max_tasks_per_child: int = 1000
+    thread_pool_size: int = 64  # Default executor threads per worker process
 
 
 class GitHubConfig(BaseModel):
@@ -72,6 +74,8 @@ class LLMConfig(BaseModel):
     base_url: Optional[str] = None
     model: Optional[str] = None
     openai_api_key: str = ""
+    max_prompt_tokens: int = 6000
+    chunk_overlap_tokens: int = 200
 
 
 class AgentConfig(BaseModel):
@@ -102,6 +106,8 @@ class CacheConfig(BaseModel):
     ttl_github_user_data: int = 7200
     max_cache_size_mb: int = 512
     github_repo_ttl: int = 300  # 5 minutes
+    github_etag_ttl: int = 86400  # 24 hours
+    github_blob_ttl: int = 604800  # 7 days
 
 
 class SecurityConfig(BaseModel):
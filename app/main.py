@@ -8,9 +8,11 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.config.settings import Settings, get_settings
 from app.config.database import db_manager
+from app.utils.redis_client import close_redis_clients
 from app.utils.logger import logger
 from app.utils.exceptions import setup_exception_handlers
 from app.api.v1.router import router as v1_router
@@ -32,6 +34,7 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down application...")
     await db_manager.close()
+    await close_redis_clients()
     logger.info("Application shutdown complete")
 
 
@@ -46,6 +49,7 @@ def create_app() -> FastAPI:
         docs_url="/docs",
         redoc_url="/redoc",
         openapi_url="/openapi.json",
+        default_response_class=ORJSONResponse,
         lifespan=lifespan,
     )
 
@@ -70,8 +70,13 @@ class AnalysisTask(SQLModel, table=True):
     )
     progress: float = Field(default=0.0, ge=0.0, le=100.0)
 
-    # Timestamps
-    created_at: datetime = Field(default_factory=lambda: datetime.now(), index=True)
+    # Timestamps, all taken from the database clock
+    created_at: Optional[datetime] = Field(
+        default=None,
+        nullable=False,
+        index=True,
+        sa_column_kwargs={"server_default": sa.func.now()},
+    )
     started_at: Optional[datetime] = Field(default=None)
     completed_at: Optional[datetime] = Field(default=None)
 
@@ -106,7 +111,11 @@ class AnalysisResult(SQLModel, table=True):
     issues: List[Dict[str, Any]] = Field(default_factory=list, sa_column=Column(JSON))
 
     # Timestamps
-    created_at: datetime = Field(default_factory=lambda: datetime.now())
+    created_at: Optional[datetime] = Field(
+        default=None,
+        nullable=False,
+        sa_column_kwargs={"server_default": sa.func.now()},
+    )
     analysis_duration: Optional[float] = None  # seconds
 
     # Relationships
@@ -142,7 +151,11 @@ class AnalysisSummary(SQLModel, table=True):
     maintainability_score: float = Field(default=0.0, ge=0.0, le=100.0)
 
     # Timestamps
-    created_at: datetime = Field(default_factory=lambda: datetime.now())
+    created_at: Optional[datetime] = Field(
+        default=None,
+        nullable=False,
+        sa_column_kwargs={"server_default": sa.func.now()},
+    )
 
     # Relationships
     task: AnalysisTask = Relationship(back_populates="summary")
@@ -2,14 +2,26 @@
 GitHub API Integration Service
 """
 
+import asyncio
 import os
 import re
+import time
 import pickle
+import random
 import hashlib
+import json
+import math
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Optional, Tuple, Any
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple, Any, Type, TypeVar
+from urllib.parse import quote
 
+import redis
 from github import Github, GithubException, Auth
+from github.ContentFile import ContentFile
+from github.File import File
+from github.GithubObject import GithubObject
 from github.PullRequest import PullRequest
 from github.Repository import Repository
 
@@ -22,6 +34,186 @@ from app.utils.exceptions import (
 )
 from app.utils.redis_client import get_sync_redis_client
 
+T = TypeVar("T")
+G = TypeVar("G", bound=GithubObject)
+
+# Accepts https://github.com/owner/repo, git@github.com:owner/repo.git and owner/repo
+_REPO_URL_PATTERN = re.compile(
+    r"^(?:https://github\.com/|git@github\.com:)?([^/:]+)/([^/]+?)(?:\.git)?$"
+)
+
+# Maximum number of blob lookups aliased into a single GraphQL query
+GRAPHQL_BATCH_SIZE = 50
+
+_BLOB_QUERY_FIELDS = "... on Blob { text isBinary isTruncated byteSize }"
+
+# Maximum number of REST content requests in flight when GraphQL cannot be used
+REST_FETCH_CONCURRENCY = 10
+
+
+@lru_cache(maxsize=None)
+def _rest_fetch_executor() -> ThreadPoolExecutor:
+    """Thread pool shared by every REST content fetch in the process."""
+    return ThreadPoolExecutor(
+        max_workers=REST_FETCH_CONCURRENCY, thread_name_prefix="github-rest"
+    )
+
+
+# Pull request metadata and one page of changed files in a single GraphQL query
+_PR_BUNDLE_QUERY = """
+query($owner: String!, $name: String!, $number: Int!, $first: Int!, $after: String) {
+  repository(owner: $owner, name: $name) {
+    pullRequest(number: $number) {
+      databaseId number title body state isDraft mergeable
+      createdAt updatedAt mergedAt closedAt
+      additions deletions changedFiles
+      author { login __typename ... on User { databaseId } ... on Bot { databaseId } }
+      baseRefName baseRefOid baseRepository { nameWithOwner }
+      headRefName headRefOid headRepository { nameWithOwner }
+      commits { totalCount }
+      labels(first: 100) { nodes { name } }
+      files(first: $first, after: $after) {
+        nodes { path additions deletions changeType }
+        pageInfo { hasNextPage endCursor }
+      }
+    }
+  }
+}
+"""
+
+# GraphQL PatchStatus values mapped to the REST file status names
+_CHANGE_TYPE_STATUS = {
+    "ADDED": "added",
+    "DELETED": "removed",
+    "MODIFIED": "modified",
+    "RENAMED": "renamed",
+    "COPIED": "copied",
+    "CHANGED": "changed",
+}
+
+# GraphQL MergeableState values mapped to the REST mergeable flag
+_MERGEABLE_STATE = {"MERGEABLE": True, "CONFLICTING": False}
+
+# Page size used when listing PR files (GitHub's maximum for this endpoint)
+PR_FILES_PAGE_SIZE = 100
+
+# Longest wait (seconds) worth spending on a rate-limited request before giving up
+RATE_LIMIT_MAX_WAIT = 60
+
+# Files that are never worth downloading for review
+_BINARY_EXTENSIONS = frozenset(
+    {
+        ".png",
+        ".jpg",
+        ".jpeg",
+        ".gif",
+        ".bmp",
+        ".webp",
+        ".ico",
+        ".pdf",
+        ".zip",
+        ".gz",
+        ".tar",
+        ".7z",
+        ".jar",
+        ".whl",
+        ".so",
+        ".dylib",
+        ".dll",
+        ".exe",
+        ".class",
+        ".pyc",
+        ".woff",
+        ".woff2",
+        ".ttf",
+        ".otf",
+        ".eot",
+        ".mp3",
+        ".mp4",
+        ".mov",
+    }
+)
+_VENDORED_DIRS = ("node_modules/", "vendor/", "dist/", "build/")
+_LOCKFILE_NAMES = frozenset(
+    {
+        "package-lock.json",
+        "yarn.lock",
+        "pnpm-lock.yaml",
+        "poetry.lock",
+        "pipfile.lock",
+        "uv.lock",
+        "cargo.lock",
+        "gemfile.lock",
+        "composer.lock",
+        "go.sum",
+    }
+)
+# Bytes inspected for NUL characters when classifying content as binary
+_BINARY_PROBE_SIZE = 8192
+
+
+class ETagCache:
+    """
+    Redis-backed store of GitHub REST responses keyed by request URL.
+
+    Cached entries are revalidated with If-None-Match; GitHub answers
+    unchanged resources with 304 Not Modified, which does not count against
+    the primary rate limit. Redis errors are logged and treated as misses so
+    caching never fails a request.
+    """
+
+    def __init__(self, redis_client: redis.Redis, scope: str, ttl: int):
+        """
+        Initialize the cache.
+
+        Args:
+            redis_client: Synchronous Redis client
+            scope: Prefix isolating entries per credential
+            ttl: Entry lifetime in seconds
+        """
+        self._redis = redis_client
+        self._scope = scope
+        self._ttl = ttl
+
+    def _key(self, url: str) -> str:
+        return f"etag:{self._scope}:{url}"
+
+    def get(self, url: str) -> Optional[Tuple[str, Any]]:
+        """
+        Get the cached response for a URL.
+
+        Args:
+            url: Request URL
+
+        Returns:
+            Tuple of (etag, body), or None if nothing is cached
+        """
+        try:
+            cached = self._redis.get(self._key(url))
+        except redis.RedisError as e:
+            logger.warning(f"ETag cache read failed for {url}: {e}")
+            return None
+        if not cached:
+            return None
+        entry = json.loads(cached)
+        return entry["etag"], entry["body"]
+
+    def put(self, url: str, etag: str, body: Any) -> None:
+        """
+        Store a response for a URL.
+
+        Args:
+            url: Request URL
+            etag: ETag header returned with the response
+            body: Decoded JSON response body
+        """
+        try:
+            self._redis.set(
+                self._key(url), json.dumps({"etag": etag, "body": body}), ex=self._ttl
+            )
+        except redis.RedisError as e:
+            logger.warning(f"ETag cache write failed for {url}: {e}")
+
 
 class GitHubService:
     """
@@ -42,6 +234,11 @@ class GitHubService:
         self._token = self._get_github_token(github_token)
         self._redis_client = get_sync_redis_client()
         self._cache_ttl = self.settings.cache.github_repo_ttl
+        self._etag_cache = ETagCache(
+            self._redis_client,
+            self._token_fingerprint,
+            self.settings.cache.github_etag_ttl,
+        )
 
         # Initialize PyGithub client
         if self._token:
@@ -58,6 +255,7 @@ class GitHubService:
             )
 
         self._rate_limit_remaining: Optional[int] = None
+        self._rate_limit_limit: Optional[int] = None
         self._rate_limit_reset: Optional[datetime] = None
 
     @property
@@ -98,21 +296,9 @@ class GitHubService:
             # Clean up URL
             repo_url = repo_url.strip().rstrip("/")
 
-            # Handle different GitHub URL formats
-            patterns = [
-                r"^https://github\.com/([^/]+)/([^/]+)/?$",  # https://github.com/owner/repo
-                r"^git@github\.com:([^/]+)/([^/]+)\.git$",  # git@github.com:owner/repo.git
-                r"^([^/]+)/([^/]+)$",  # owner/repo
-            ]
-
-            for pattern in patterns:
-                match = re.match(pattern, repo_url)
-                if match:
-                    owner, repo = match.groups()
-                    # Remove .git suffix if present
-                    if repo.endswith(".git"):
-                        repo = repo[:-4]
-                    return owner, repo
+            match = _REPO_URL_PATTERN.match(repo_url)
+            if match:
+                return match.group(1), match.group(2)
 
             raise InvalidRepositoryException(
                 repo_url,
@@ -127,55 +313,100 @@ class GitHubService:
             )
 
     def _update_rate_limit_info(self) -> None:
-        """Update internal rate limit information."""
-        try:
-            rate_limit = self._github.get_rate_limit()
+        """
+        Update internal rate limit information from the last API response.
 
-            logger.debug(
-                f"Rate limit object type: {type(rate_limit)}, attributes: {dir(rate_limit)}"
+        PyGithub records the X-RateLimit-* headers of every response on its
+        requester, so reading them costs no extra API call.
+        """
+        remaining, limit = self._github.requester.rate_limiting
+        if remaining < 0:
+            # No response has been received yet
+            return
+
+        reset_timestamp = self._github.requester.rate_limiting_resettime
+        self._rate_limit_remaining = remaining
+        self._rate_limit_limit = limit
+        self._rate_limit_reset = (
+            datetime.fromtimestamp(reset_timestamp) if reset_timestamp else None
+        )
+
+        logger.debug(
+            f"GitHub rate limit: {self._rate_limit_remaining} requests remaining, "
+            f"resets at {self._rate_limit_reset}"
+        )
+
+        # Warn if running low on requests
+        if self._rate_limit_remaining < 100:
+            logger.warning(
+                f"GitHub rate limit running low: {self._rate_limit_remaining} requests remaining"
             )
 
-            # Handle different PyGithub versions and rate limit object structures
-            if hasattr(rate_limit, "core"):
-                # Newer PyGithub versions
-                core_limit = rate_limit.core
-                self._rate_limit_remaining = core_limit.remaining
-                self._rate_limit_reset = core_limit.reset
-                logger.debug(
-                    f"Used core rate limit: {self._rate_limit_remaining} remaining"
-                )
-            elif hasattr(rate_limit, "rate"):
-                # Try rate attribute
-                rate_info = rate_limit.rate
-                self._rate_limit_remaining = rate_info.remaining
-                self._rate_limit_reset = rate_info.reset
-                logger.debug(
-                    f"Used rate attribute: {self._rate_limit_remaining} remaining"
-                )
-            else:
-                logger.warning(
-                    f"Unknown rate limit structure, attributes: {dir(rate_limit)}"
-                )
-                # Set conservative defaults
-                self._rate_limit_remaining = 1000
-                self._rate_limit_reset = None
+    @staticmethod
+    def _exception_headers(e: GithubException) -> Dict[str, str]:
+        """Response headers of a GitHub exception, keyed in lowercase."""
+        return {key.lower(): value for key, value in (e.headers or {}).items()}
+
+    @classmethod
+    def _is_rate_limited(cls, e: GithubException) -> bool:
+        """Check whether a GitHub exception is a primary or secondary rate limit."""
+        if e.status == 429:
+            return True
+        if e.status != 403:
+            return False
+        headers = cls._exception_headers(e)
+        return (
+            "rate limit" in str(e.data).lower()
+            or headers.get("x-ratelimit-remaining") == "0"
+            or "retry-after" in headers
+        )
+
+    @classmethod
+    def _rate_limit_wait(cls, e: GithubException, attempt: int) -> float:
+        """
+        Seconds to wait before retrying a rate-limited request.
 
-            logger.debug(
-                f"GitHub rate limit: {self._rate_limit_remaining} requests remaining, "
-                f"resets at {self._rate_limit_reset}"
-            )
+        Honours Retry-After / X-RateLimit-Reset when present, otherwise backs
+        off exponentially (1s, 2s, 4s, ...).
+        """
+        headers = cls._exception_headers(e)
+        try:
+            if "retry-after" in headers:
+                return float(headers["retry-after"])
+            if "x-ratelimit-reset" in headers:
+                return max(int(headers["x-ratelimit-reset"]) - time.time(), 0.0)
+        except (ValueError, TypeError):
+            pass
+        return float(2**attempt)
+
+    def _retry(self, operation: str, func: Callable[..., T], *args, **kwargs) -> T:
+        """
+        Call a PyGithub function, retrying with backoff on rate limits.
 
-            # Warn if running low on requests
-            if self._rate_limit_remaining and self._rate_limit_remaining < 100:
+        Transient (secondary) rate limits usually clear within seconds, so the
+        call is retried up to ``github.max_retries`` times. If the limit resets
+        further out than RATE_LIMIT_MAX_WAIT, the exception is raised immediately.
+
+        Args:
+            operation: Description of the operation, used for logging
+            func: PyGithub callable to invoke
+        """
+        max_retries = self.settings.github.max_retries
+        for attempt in range(max_retries + 1):
+            try:
+                return func(*args, **kwargs)
+            except GithubException as e:
+                if attempt >= max_retries or not self._is_rate_limited(e):
+                    raise
+                wait = self._rate_limit_wait(e, attempt)
+                if wait > RATE_LIMIT_MAX_WAIT:
+                    raise
+                wait += random.uniform(0, 0.5)
                 logger.warning(
-                    f"GitHub rate limit running low: {self._rate_limit_remaining} requests remaining"
+                    f"GitHub rate limit hit during {operation}, retrying in {wait:.1f}s "
+                    f"(attempt {attempt + 1}/{max_retries})"
                 )
-
-        except Exception as e:
-            logger.warning(f"Failed to check GitHub rate limit: {e}")
-            # Set defaults to avoid breaking the service
-            self._rate_limit_remaining = 1000  # Conservative default
-            self._rate_limit_reset = None
+                time.sleep(wait)
 
     def _handle_github_exception(self, e: GithubException, operation: str) -> None:
         """
@@ -191,20 +422,25 @@ class GitHubService:
                 status_code=401,
                 details={"operation": operation, "github_status": e.status},
             )
-        elif e.status == 403:
+        elif e.status in (403, 429):
             # Could be rate limit or permissions
-            if "rate limit" in str(e.data).lower():
+            if self._is_rate_limited(e):
+                headers = self._exception_headers(e)
                 reset_time = None
-                if hasattr(e, "headers") and "X-RateLimit-Reset" in e.headers:
-                    try:
-                        reset_timestamp = int(e.headers["X-RateLimit-Reset"])
+                retry_after = 3600  # Default to 1 hour
+                try:
+                    if "retry-after" in headers:
+                        retry_after = max(int(headers["retry-after"]), 1)
+                    elif "x-ratelimit-reset" in headers:
+                        reset_timestamp = int(headers["x-ratelimit-reset"])
                         reset_time = datetime.fromtimestamp(reset_timestamp)
-                    except (ValueError, TypeError):
-                        pass
+                        retry_after = max(int(reset_timestamp - time.time()), 1)
+                except (ValueError, TypeError):
+                    pass
 
                 raise RateLimitExceededException(
                     f"GitHub API rate limit exceeded during {operation}",
-                    retry_after=3600,  # Default to 1 hour
+                    retry_after=retry_after,
                     details={
                         "operation": operation,
                         "reset_time": reset_time.isoformat() if reset_time else None,
@@ -235,6 +471,54 @@ class GitHubService:
                 },
             )
 
+    def _conditional_get(self, url: str, operation: str) -> Any:
+        """
+        GET a REST resource, revalidating any cached copy with its ETag.
+
+        Args:
+            url: API URL, absolute or relative to the API root
+            operation: Description used in retry logs
+
+        Returns:
+            Decoded JSON body, served from the cache on 304 Not Modified
+        """
+        cached = self._etag_cache.get(url)
+        headers = {"If-None-Match": cached[0]} if cached else None
+
+        response_headers, data = self._retry(
+            operation,
+            self._github.requester.requestJsonAndCheck,
+            "GET",
+            url,
+            headers=headers,
+        )
+        self._update_rate_limit_info()
+
+        # A 304 carries no body
+        if cached and data is None:
+            logger.debug("Not modified, using cached response: {}", url)
+            return cached[1]
+
+        etag = response_headers.get("etag")
+        if etag:
+            self._etag_cache.put(url, etag, data)
+        return data
+
+    def _get_object(self, klass: Type[G], url: str, operation: str) -> G:
+        """
+        Fetch a REST resource through the ETag cache as a PyGithub object.
+
+        Args:
+            klass: PyGithub class to build
+            url: API URL, absolute or relative to the API root
+            operation: Description used in retry logs
+
+        Returns:
+            Instance of klass built from the response
+        """
+        data = self._conditional_get(url, operation)
+        return self._github.create_from_raw_data(klass, data)
+
     def get_repository(self, repo_url: str) -> Repository:
         """
         Get GitHub repository object with caching.
@@ -269,7 +553,9 @@ class GitHubService:
                     )
 
             logger.info(f"Fetching repository from GitHub API: {full_name}")
-            repository = self._github.get_repo(full_name)
+            repository = self._retry(
+                f"fetching repository {full_name}", self._github.get_repo, full_name
+            )
 
             # Cache the repository
             try:
@@ -314,11 +600,15 @@ class GitHubService:
             GitHubAPIException: If API request fails
         """
         try:
-            repository = self.get_repository(repo_url)
+            owner, repo_name = self._parse_repo_url(repo_url)
 
-            logger.debug(f"Fetching PR #{pr_number} from {repository.full_name}")
+            logger.debug(f"Fetching PR #{pr_number} from {owner}/{repo_name}")
 
-            pull_request = repository.get_pull(pr_number)
+            pull_request = self._get_object(
+                PullRequest,
+                f"/repos/{owner}/{repo_name}/pulls/{pr_number}",
+                f"fetching PR #{pr_number}",
+            )
 
             logger.info(
                 f"Successfully fetched PR #{pr_number}: '{pull_request.title}' "
@@ -408,6 +698,34 @@ class GitHubService:
                 details={"repo_url": repo_url, "pr_number": pr_number},
             )
 
+    def _list_pull_request_files(
+        self, pull_request: PullRequest, limit: int
+    ) -> List[File]:
+        """
+        List the files changed in a pull request, one ETag-cached page at a time.
+
+        Args:
+            pull_request: Pull request to list files for
+            limit: Maximum number of files to return
+
+        Returns:
+            Changed files in GitHub's order
+        """
+        files: List[File] = []
+        page = 1
+        while len(files) < limit:
+            items = self._conditional_get(
+                f"{pull_request.url}/files?per_page={PR_FILES_PAGE_SIZE}&page={page}",
+                f"listing files of PR #{pull_request.number}",
+            )
+            files.extend(
+                self._github.create_from_raw_data(File, item) for item in items
+            )
+            if len(items) < PR_FILES_PAGE_SIZE:
+                break
+            page += 1
+        return files[:limit]
+
     def get_pull_request_files(self, repo_url: str, pr_number: int) -> Dict[str, Any]:
         """
         Get list of files changed in a pull request with their details.
@@ -421,11 +739,11 @@ class GitHubService:
         """
         try:
             pull_request = self.get_pull_request(repo_url, pr_number)
-            files = pull_request.get_files()
 
             # Check file count limit
             max_files = self.settings.github.max_files_per_pr
             file_count = pull_request.changed_files
+            files = self._list_pull_request_files(pull_request, max_files)
 
             if file_count > max_files:
                 logger.warning(
@@ -496,6 +814,176 @@ class GitHubService:
                 details={"repo_url": repo_url, "pr_number": pr_number},
             )
 
+    def get_pull_request_bundle(self, repo_url: str, pr_number: int) -> Dict[str, Any]:
+        """
+        Get pull request metadata and changed files in as few requests as possible.
+
+        Authenticated services fetch both through one GraphQL query per
+        PR_FILES_PAGE_SIZE files; unauthenticated services fall back to the
+        REST endpoints.
+
+        GraphQL's PullRequestChangedFile has no diff, blob SHA or previous
+        path, so file entries fetched that way have patch, sha,
+        previous_filename, blob_url and raw_url set to None. Callers that
+        need them must use get_pull_request_files.
+
+        Args:
+            repo_url: GitHub repository URL
+            pr_number: Pull request number
+
+        Returns:
+            Dictionary with "metadata" shaped like get_pull_request_metadata
+            and "files" shaped like get_pull_request_files
+        """
+        if not self.is_authenticated:
+            return {
+                "metadata": self.get_pull_request_metadata(repo_url, pr_number),
+                "files": self.get_pull_request_files(repo_url, pr_number),
+            }
+
+        try:
+            return self._get_pull_request_bundle_graphql(repo_url, pr_number)
+        except (
+            InvalidRepositoryException,
+            GitHubAPIException,
+            RateLimitExceededException,
+        ):
+            raise
+        except Exception as e:
+            raise GitHubAPIException(
+                f"Failed to get PR bundle for #{pr_number}: {str(e)}",
+                details={"repo_url": repo_url, "pr_number": pr_number},
+            )
+
+    def _get_pull_request_bundle_graphql(
+        self, repo_url: str, pr_number: int
+    ) -> Dict[str, Any]:
+        """GraphQL implementation of get_pull_request_bundle."""
+        owner, repo_name = self._parse_repo_url(repo_url)
+        max_files = self.settings.github.max_files_per_pr
+        variables: Dict[str, Any] = {
+            "owner": owner,
+            "name": repo_name,
+            "number": pr_number,
+            "first": PR_FILES_PAGE_SIZE,
+            "after": None,
+        }
+
+        pull_request = None
+        file_nodes: List[Dict[str, Any]] = []
+        while len(file_nodes) < max_files:
+            try:
+                _, data = self._retry(
+                    f"fetching PR #{pr_number} from {owner}/{repo_name}",
+                    self._github.requester.graphql_query,
+                    _PR_BUNDLE_QUERY,
+                    variables,
+                )
+            except GithubException as e:
+                self._handle_github_exception(
+                    e, f"fetching PR #{pr_number} from {repo_url}"
+                )
+
+            repository = data["data"]["repository"]
+            pull_request = repository and repository["pullRequest"]
+            if not pull_request:
+                raise GitHubAPIException(
+                    f"PR #{pr_number} not found in {owner}/{repo_name}",
+                    status_code=404,
+                    details={"repo_url": repo_url, "pr_number": pr_number},
+                )
+
+            files = pull_request["files"]
+            file_nodes.extend(files["nodes"])
+            if not files["pageInfo"]["hasNextPage"]:
+                break
+            variables["after"] = files["pageInfo"]["endCursor"]
+
+        self._update_rate_limit_info()
+
+        file_count = pull_request["changedFiles"]
+        if file_count > max_files:
+            logger.warning(
+                f"PR #{pr_number} has {file_count} files, exceeding limit of {max_files}. "
+                "Only first files will be processed."
+            )
+
+        # Fields PullRequestChangedFile does not expose are left as None
+        processed_files = [
+            {
+                "filename": node["path"],
+                "previous_filename": None,
+                "status": _CHANGE_TYPE_STATUS.get(
+                    node["changeType"], node["changeType"].lower()
+                ),
+                "additions": node["additions"],
+                "deletions": node["deletions"],
+                "changes": node["additions"] + node["deletions"],
+                "sha": None,
+                "blob_url": None,
+                "raw_url": None,
+                "patch": None,
+            }
+            for node in file_nodes[:max_files]
+        ]
+
+        author = pull_request["author"] or {}
+        base_repo = pull_request["baseRepository"] or {}
+        head_repo = pull_request["headRepository"] or {}
+        metadata = {
+            "id": pull_request["databaseId"],
+            "number": pull_request["number"],
+            "title": pull_request["title"],
+            "body": pull_request["body"],
+            # REST reports merged PRs as closed
+            "state": "open" if pull_request["state"] == "OPEN" else "closed",
+            "created_at": pull_request["createdAt"],
+            "updated_at": pull_request["updatedAt"],
+            "merged_at": pull_request["mergedAt"],
+            "closed_at": pull_request["closedAt"],
+            "author": {
+                "login": author.get("login"),
+                "id": author.get("databaseId"),
+                "type": author.get("__typename"),
+            },
+            "base": {
+                "ref": pull_request["baseRefName"],
+                "sha": pull_request["baseRefOid"],
+                "repo": base_repo.get("nameWithOwner"),
+            },
+            "head": {
+                "ref": pull_request["headRefName"],
+                "sha": pull_request["headRefOid"],
+                "repo": head_repo.get("nameWithOwner"),
+            },
+            "stats": {
+                "additions": pull_request["additions"],
+                "deletions": pull_request["deletions"],
+                "changed_files": file_count,
+                "commits": pull_request["commits"]["totalCount"],
+            },
+            "mergeable": _MERGEABLE_STATE.get(pull_request["mergeable"]),
+            "draft": pull_request["isDraft"],
+            "labels": [label["name"] for label in pull_request["labels"]["nodes"]],
+        }
+
+        logger.info(
+            f"Retrieved PR #{pr_number} with {len(processed_files)} files "
+            f"from {owner}/{repo_name}"
+        )
+        return {
+            "metadata": metadata,
+            "files": {
+                "files": processed_files,
+                "metadata": {
+                    "total_files_in_pr": file_count,
+                    "processed_files": len(processed_files),
+                    "total_size_bytes": 0,
+                    "truncated": len(processed_files) < file_count,
+                },
+            },
+        }
+
     def get_file_content(
         self, repo_url: str, file_path: str, commit_sha: str
     ) -> Dict[str, Any]:
@@ -510,14 +998,22 @@ class GitHubService:
         Returns:
             Dictionary containing file content and metadata
         """
+        reason = self.skip_reason(file_path)
+        if reason:
+            return self._skipped_file_result(file_path, reason)
+
         try:
-            repository = self.get_repository(repo_url)
+            owner, repo_name = self._parse_repo_url(repo_url)
 
             # Get file content at specific commit
-            file_content = repository.get_contents(file_path, ref=commit_sha)
+            data = self._conditional_get(
+                f"/repos/{owner}/{repo_name}/contents/{quote(file_path)}"
+                f"?ref={quote(commit_sha, safe='')}",
+                f"fetching file content for {file_path}",
+            )
 
             # Handle if it's a file (not a directory)
-            if not hasattr(file_content, "decoded_content"):
+            if not isinstance(data, dict) or data.get("type") != "file":
                 raise GitHubAPIException(
                     f"Path {file_path} is not a file",
                     details={
@@ -526,6 +1022,7 @@ class GitHubService:
                         "commit_sha": commit_sha,
                     },
                 )
+            file_content = self._github.create_from_raw_data(ContentFile, data)
 
             # Check file size
             max_file_size = self.settings.github.max_file_size_kb * 1024
@@ -540,15 +1037,20 @@ class GitHubService:
                     },
                 )
 
-            try:
-                # Try to decode content as text
-                content_text = file_content.decoded_content.decode("utf-8")
-                is_text = True
-            except UnicodeDecodeError:
-                # Binary file
-                content_text = None
-                is_text = False
-                logger.debug(f"File {file_path} appears to be binary")
+            # decoded_content base64-decodes on every access, so read it once
+            raw_content = file_content.decoded_content
+            content_text = None
+            is_text = False
+            if b"\x00" in raw_content[:_BINARY_PROBE_SIZE]:
+                logger.debug("File {} appears to be binary", file_path)
+            else:
+                try:
+                    # Try to decode content as text
+                    content_text = raw_content.decode("utf-8")
+                    is_text = True
+                except UnicodeDecodeError:
+                    # Binary file
+                    logger.debug("File {} appears to be binary", file_path)
 
             result = {
                 "path": file_path,
@@ -564,7 +1066,7 @@ class GitHubService:
             }
 
             logger.debug(
-                f"Retrieved content for file {file_path} ({file_content.size} bytes)"
+                "Retrieved content for file {} ({} bytes)", file_path, file_content.size
             )
             return result
 
@@ -582,6 +1084,247 @@ class GitHubService:
                 },
             )
 
+    def _fetch_files_rest(
+        self, repo_url: str, file_paths: List[str], commit_sha: str
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch files one REST call each, overlapping up to REST_FETCH_CONCURRENCY
+        requests on a thread pool shared across calls.
+
+        Args:
+            repo_url: GitHub repository URL
+            file_paths: Paths of the files in the repository
+            commit_sha: Git commit SHA
+
+        Returns:
+            Dictionary mapping file path to its get_file_content result, in
+            input order. Files that fail to fetch are omitted.
+        """
+
+        def fetch(file_path: str) -> Optional[Dict[str, Any]]:
+            try:
+                return self.get_file_content(repo_url, file_path, commit_sha)
+            except GitHubAPIException as e:
+                logger.warning(f"Could not fetch content for {file_path}: {e}")
+                return None
+
+        if not file_paths:
+            return {}
+
+        fetched = list(_rest_fetch_executor().map(fetch, file_paths))
+
+        return {
+            file_path: content
+            for file_path, content in zip(file_paths, fetched)
+            if content is not None
+        }
+
+    def get_files_content_batch(
+        self, repo_url: str, file_paths: List[str], commit_sha: str
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the content of several files at a given commit.
+
+        Blobs are looked up through GraphQL, up to GRAPHQL_BATCH_SIZE files per
+        request, instead of one REST call per file. GraphQL requires
+        authentication, so unauthenticated services fall back to
+        concurrent get_file_content calls, one per file. Contents already
+        fetched at the same commit are served from Redis.
+
+        Args:
+            repo_url: GitHub repository URL
+            file_paths: Paths of the files in the repository
+            commit_sha: Git commit SHA
+
+        Returns:
+            Dictionary mapping file path to a dict with "path", "name",
+            "content", "is_text" and "size". Files that do not exist at the
+            commit, exceed the size limit or fail to fetch are omitted.
+        """
+        results: Dict[str, Dict[str, Any]] = {}
+        to_fetch = []
+        for file_path in file_paths:
+            reason = self.skip_reason(file_path)
+            if reason:
+                results[file_path] = self._skipped_file_result(file_path, reason)
+            else:
+                to_fetch.append(file_path)
+
+        # Content at a commit never changes, so earlier fetches can be reused
+        cache_keys = self._blob_cache_keys(repo_url, to_fetch, commit_sha)
+        cached = self._get_cached_blobs(cache_keys)
+        results.update(cached)
+        to_fetch = [file_path for file_path in to_fetch if file_path not in cached]
+
+        if self.is_authenticated:
+            fetched = self._fetch_files_graphql(repo_url, to_fetch, commit_sha)
+        else:
+            fetched = self._fetch_files_rest(repo_url, to_fetch, commit_sha)
+
+        self._cache_blobs(cache_keys, fetched)
+        results.update(fetched)
+        return results
+
+    def _fetch_files_graphql(
+        self, repo_url: str, file_paths: List[str], commit_sha: str
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch files through batched GraphQL blob lookups.
+
+        Args:
+            repo_url: GitHub repository URL
+            file_paths: Paths of the files in the repository
+            commit_sha: Git commit SHA
+
+        Returns:
+            Dictionary mapping file path to its content result. Files that do
+            not exist at the commit or exceed the size limit are omitted.
+        """
+        results: Dict[str, Dict[str, Any]] = {}
+        owner, repo_name = self._parse_repo_url(repo_url)
+        max_file_size = self.settings.github.max_file_size_kb * 1024
+        truncated = []
+
+        for start in range(0, len(file_paths), GRAPHQL_BATCH_SIZE):
+            batch = file_paths[start : start + GRAPHQL_BATCH_SIZE]
+            variables: Dict[str, Any] = {"owner": owner, "name": repo_name}
+            declarations = ["$owner: String!", "$name: String!"]
+            selections = []
+            for index, file_path in enumerate(batch):
+                variables[f"e{index}"] = f"{commit_sha}:{file_path}"
+                declarations.append(f"$e{index}: String!")
+                selections.append(
+                    f"f{index}: object(expression: $e{index}) {{ {_BLOB_QUERY_FIELDS} }}"
+                )
+            query = (
+                f"query({', '.join(declarations)}) {{ "
+                f"repository(owner: $owner, name: $name) {{ {' '.join(selections)} }} }}"
+            )
+
+            try:
+                _, data = self._retry(
+                    f"fetching {len(batch)} files from {owner}/{repo_name}",
+                    self._github.requester.graphql_query,
+                    query,
+                    variables,
+                )
+            except GithubException as e:
+                self._handle_github_exception(
+                    e, f"fetching file contents from {owner}/{repo_name}"
+                )
+
+            repository = data["data"]["repository"] or {}
+            for index, file_path in enumerate(batch):
+                blob = repository.get(f"f{index}")
+                if not blob:
+                    logger.debug("File {} not found at {}", file_path, commit_sha)
+                    continue
+                if blob["byteSize"] > max_file_size:
+                    logger.warning(
+                        f"Skipping file {file_path}: size {blob['byteSize']} bytes "
+                        f"exceeds limit of {max_file_size} bytes"
+                    )
+                    continue
+                if blob["isTruncated"]:
+                    truncated.append(file_path)
+                    continue
+
+                is_text = not blob["isBinary"] and blob["text"] is not None
+                results[file_path] = {
+                    "path": file_path,
+                    "name": os.path.basename(file_path),
+                    "size": blob["byteSize"],
+                    "content": blob["text"] if is_text else None,
+                    "is_text": is_text,
+                }
+
+        # GraphQL truncates very large blobs; fetch those through REST
+        results.update(self._fetch_files_rest(repo_url, truncated, commit_sha))
+
+        self._update_rate_limit_info()
+        logger.debug(
+            f"Retrieved content for {len(results)}/{len(file_paths)} files "
+            f"from {owner}/{repo_name}"
+        )
+        return results
+
+    def _blob_cache_keys(
+        self, repo_url: str, file_paths: List[str], commit_sha: str
+    ) -> Dict[str, str]:
+        """Map file paths to their content cache keys, scoped per credential."""
+        owner, repo_name = self._parse_repo_url(repo_url)
+        prefix = f"blob:{self._token_fingerprint}:{owner}/{repo_name}:{commit_sha}"
+        return {file_path: f"{prefix}:{file_path}" for file_path in file_paths}
+
+    def _get_cached_blobs(self, cache_keys: Dict[str, str]) -> Dict[str, Dict]:
+        """Read cached file contents in one round trip; Redis errors are misses."""
+        if not cache_keys:
+            return {}
+        try:
+            values = self._redis_client.mget(list(cache_keys.values()))
+        except redis.RedisError as e:
+            logger.warning(f"File content cache read failed: {e}")
+            return {}
+        return {
+            file_path: json.loads(value)
+            for file_path, value in zip(cache_keys, values)
+            if value
+        }
+
+    def _cache_blobs(
+        self, cache_keys: Dict[str, str], contents: Dict[str, Dict[str, Any]]
+    ) -> None:
+        """Store fetched file contents for reuse by later analyses of the commit."""
+        if not contents:
+            return
+        try:
+            with self._redis_client.pipeline(transaction=False) as pipe:
+                for file_path, content in contents.items():
+                    pipe.set(
+                        cache_keys[file_path],
+                        json.dumps(content),
+                        ex=self.settings.cache.github_blob_ttl,
+                    )
+                pipe.execute()
+        except redis.RedisError as e:
+            logger.warning(f"File content cache write failed: {e}")
+
+    @staticmethod
+    def _skipped_file_result(file_path: str, skip_reason: str) -> Dict[str, Any]:
+        """Build the get_file_content result for a file that was not fetched."""
+        logger.debug("Skipping fetch of {} file {}", skip_reason, file_path)
+        return {
+            "path": file_path,
+            "name": os.path.basename(file_path),
+            "content": None,
+            "is_text": False,
+            "skip_reason": skip_reason,
+        }
+
+    @staticmethod
+    def skip_reason(file_path: str) -> Optional[str]:
+        """
+        Classify files that should not be fetched by path alone.
+
+        Args:
+            file_path: Path of the file in the repository
+
+        Returns:
+            "binary", "lockfile" or "vendored" if the file should be skipped,
+            else None
+        """
+        if os.path.splitext(file_path)[1].lower() in _BINARY_EXTENSIONS:
+            return "binary"
+        if os.path.basename(file_path).lower() in _LOCKFILE_NAMES:
+            return "lockfile"
+        path = file_path.lstrip("/")
+        if any(
+            path.startswith(vendored) or f"/{vendored}" in path
+            for vendored in _VENDORED_DIRS
+        ):
+            return "vendored"
+        return None
+
     @property
     def is_authenticated(self) -> bool:
         """Check if service is authenticated with GitHub."""
@@ -592,11 +1335,119 @@ class GitHubService:
         """Get remaining API requests."""
         return self._rate_limit_remaining
 
+    @property
+    def rate_limit_limit(self) -> Optional[int]:
+        """Get the number of requests allowed per rate limit window."""
+        return self._rate_limit_limit
+
+    @property
+    def rate_limit_reset(self) -> Optional[datetime]:
+        """Get the time the current rate limit window resets."""
+        return self._rate_limit_reset
+
+    def content_fetch_cost(self, file_count: int) -> int:
+        """
+        Estimate the requests get_files_content_batch spends on a set of files.
+
+        Args:
+            file_count: Number of files to fetch
+
+        Returns:
+            GraphQL queries needed when authenticated, else one REST call per file
+        """
+        if self.is_authenticated:
+            return math.ceil(file_count / GRAPHQL_BATCH_SIZE)
+        return file_count
+
     def __str__(self) -> str:
         """String representation of GitHub service."""
         auth_status = "authenticated" if self.is_authenticated else "unauthenticated"
         return f"GitHubService({auth_status})"
 
 
-# Export the service class
-__all__ = ["GitHubService"]
+class AsyncGitHubService:
+    """
+    Async facade over GitHubService.
+
+    PyGithub is synchronous, so each call is run in the default thread pool
+    to keep the event loop free. A semaphore caps how many GitHub requests
+    are in flight at once.
+    """
+
+    def __init__(self, github_service: GitHubService, max_concurrency: int = 8):
+        """
+        Wrap an existing GitHub service.
+
+        Args:
+            github_service: Synchronous service to delegate to
+            max_concurrency: Maximum number of concurrent GitHub calls
+        """
+        self._sync = github_service
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _run(self, func: Callable[..., T], *args) -> T:
+        async with self._semaphore:
+            return await asyncio.to_thread(func, *args)
+
+    async def get_pull_request_metadata(
+        self, repo_url: str, pr_number: int
+    ) -> Dict[str, Any]:
+        """Async version of GitHubService.get_pull_request_metadata."""
+        return await self._run(
+            self._sync.get_pull_request_metadata, repo_url, pr_number
+        )
+
+    async def get_pull_request_files(
+        self, repo_url: str, pr_number: int
+    ) -> Dict[str, Any]:
+        """Async version of GitHubService.get_pull_request_files."""
+        return await self._run(self._sync.get_pull_request_files, repo_url, pr_number)
+
+    async def get_pull_request_bundle(
+        self, repo_url: str, pr_number: int
+    ) -> Dict[str, Any]:
+        """Async version of GitHubService.get_pull_request_bundle."""
+        return await self._run(self._sync.get_pull_request_bundle, repo_url, pr_number)
+
+    async def get_file_content(
+        self, repo_url: str, file_path: str, commit_sha: str
+    ) -> Dict[str, Any]:
+        """Async version of GitHubService.get_file_content."""
+        return await self._run(
+            self._sync.get_file_content, repo_url, file_path, commit_sha
+        )
+
+    async def get_files_content_batch(
+        self, repo_url: str, file_paths: List[str], commit_sha: str
+    ) -> Dict[str, Dict[str, Any]]:
+        """Async version of GitHubService.get_files_content_batch."""
+        return await self._run(
+            self._sync.get_files_content_batch, repo_url, file_paths, commit_sha
+        )
+
+    @property
+    def rate_limit_remaining(self) -> Optional[int]:
+        """Get remaining API requests."""
+        return self._sync.rate_limit_remaining
+
+    @property
+    def rate_limit_limit(self) -> Optional[int]:
+        """Get the number of requests allowed per rate limit window."""
+        return self._sync.rate_limit_limit
+
+    @property
+    def rate_limit_reset(self) -> Optional[datetime]:
+        """Get the time the current rate limit window resets."""
+        return self._sync.rate_limit_reset
+
+    def content_fetch_cost(self, file_count: int) -> int:
+        """Same as GitHubService.content_fetch_cost."""
+        return self._sync.content_fetch_cost(file_count)
+
+    def __str__(self) -> str:
+        """String representation of the async GitHub service."""
+        return f"Async{self._sync}"
+
+
+# Export the service classes
+__all__ = ["GitHubService", "AsyncGitHubService"]
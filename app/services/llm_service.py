@@ -5,11 +5,15 @@ Handles all interactions with the Large Language Model (LLM) provider,
 including prompt formatting, API calls, and response parsing/validation.
 """
 
-from typing import Any, Dict, List
+import asyncio
+import re
+from collections import Counter
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
 
 from openai import AsyncOpenAI
-import instructor
+import tiktoken
 from pydantic import BaseModel, Field, field_validator
 
 from app.config.settings import get_settings
@@ -52,11 +56,39 @@ class AIAnalysisResult(BaseModel):
     )
 
 
+# Well-known generated-code headers, only honoured on the leading comment
+# lines: the "@generated" tag and Go's "Code generated ... DO NOT EDIT." line
+_GENERATED_TAG_RE = re.compile(r"@generated\b")
+_GO_GENERATED_RE = re.compile(r"^Code generated .* DO NOT EDIT\.$")
+_COMMENT_PREFIXES = ("#", "//", "/*", "*", "--", ";", "<!--")
+# Bytes of the file header searched for generated-code comments
+_GENERATED_HEADER_SIZE = 1024
+# Average line length above which a file is treated as minified
+_MINIFIED_AVG_LINE_LENGTH = 500
+
+
+@lru_cache(maxsize=None)
+def _load_encoding(model: Optional[str]) -> Optional[tiktoken.Encoding]:
+    """Load the tokenizer for a model, falling back to cl100k_base."""
+    try:
+        try:
+            return tiktoken.encoding_for_model(model or "")
+        except KeyError:
+            return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        logger.warning(f"Tokenizer unavailable, large files will not be chunked: {e}")
+        return None
+
+
 class LLMService:
     """
     Service for interacting with an OpenAI-compatible LLM.
     """
 
+    # Allowed enum values listed in every prompt, built once
+    _ISSUE_TYPES_STR = ", ".join(e.value for e in IssueType)
+    _SEVERITIES_STR = ", ".join(e.value for e in IssueSeverity)
+
     def __init__(self):
         """Initialize the LLM service."""
         self.settings = get_settings()
@@ -68,16 +100,24 @@ class LLMService:
         )
 
         # Configure the OpenAI client
-        self.client = instructor.patch(
-            AsyncOpenAI(
-                api_key=self.settings.llm.openai_api_key,
-                base_url=self.settings.llm.base_url,
-            )
+        self.client = AsyncOpenAI(
+            api_key=self.settings.llm.openai_api_key,
+            base_url=self.settings.llm.base_url,
         )
         self.model = self.settings.llm.model
+        self._enc = _load_encoding(self.model)
+        # Bounds in-flight completions across all files and their chunks, so
+        # splitting large files cannot burst past the provider's rate limits
+        self._request_slots = asyncio.Semaphore(
+            self.settings.agent.max_concurrent_analyses
+        )
 
     async def analyze_code(
-        self, file_path: str, code_content: str, analysis_type: str
+        self,
+        file_path: str,
+        code_content: str,
+        analysis_type: str,
+        tokens: Optional[List[int]] = None,
     ) -> List[Dict[str, Any]]:
         """
         Analyze code content using the configured LLM.
@@ -86,10 +126,63 @@ class LLMService:
             file_path: The path of the file being analyzed.
             code_content: The content of the code to analyze.
             analysis_type: The type of analysis to perform (e.g., 'bug', 'performance').
+            tokens: The content already encoded with `encode`, if available.
 
         Returns:
             A list of validated issues found in the code.
         """
+        skip_reason = self._skip_reason(code_content)
+        if skip_reason:
+            logger.info(f"Skipping {file_path}: {skip_reason}")
+            return []
+
+        chunks = self._split_into_chunks(code_content, tokens)
+        if len(chunks) == 1:
+            validated_issues = await self._analyze_chunk(
+                file_path, code_content, analysis_type
+            )
+        else:
+            logger.debug(
+                f"Splitting {file_path} into {len(chunks)} chunks for LLM analysis"
+            )
+            chunk_results = await asyncio.gather(
+                *(
+                    self._analyze_chunk(file_path, chunk, analysis_type)
+                    for _, chunk in chunks
+                )
+            )
+
+            # Shift chunk-relative line numbers back to file lines. Lines in the
+            # overlap with the previous chunk are reviewed twice, so an issue
+            # there is dropped when the previous chunk already reported one of
+            # the same type on that line; everything else is kept as reported
+            validated_issues = []
+            previous_end = 0
+            previous_keys: Counter = Counter()
+            for (line_offset, chunk), issues in zip(chunks, chunk_results):
+                keys: Counter = Counter()
+                for issue in issues:
+                    issue["line"] += line_offset
+                    key = (issue["type"], issue["line"])
+                    keys[key] += 1
+                    if issue["line"] <= previous_end and previous_keys[key]:
+                        previous_keys[key] -= 1
+                        continue
+                    validated_issues.append(issue)
+                previous_end = line_offset + chunk.count("\n") + 1
+                previous_keys = keys
+
+        logger.info(
+            f"LLM analysis for {file_path} found {len(validated_issues)} issues."
+        )
+        return validated_issues
+
+    async def _analyze_chunk(
+        self, file_path: str, code_content: str, analysis_type: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Send a single prompt to the LLM and return the validated issues.
+        """
         prompt = self._create_prompt(file_path, code_content, analysis_type)
 
         try:
@@ -97,32 +190,130 @@ class LLMService:
                 f"Sending request to LLM for {analysis_type} analysis of {file_path}"
             )
 
-            # Use instructor to get structured output
-            response: AIAnalysisResult = await self.client.chat.completions.create(
-                model=self.model,
-                response_model=AIAnalysisResult,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are an expert code reviewer. Analyze the provided code and identify issues. Respond only with the structured JSON as requested.",
-                    },
-                    {"role": "user", "content": prompt},
-                ],
-                max_retries=2,
-            )
+            # Use the provider's native structured output (strict JSON schema),
+            # so the response is schema-valid without client-side retries
+            async with self._request_slots:
+                completion = await self.client.chat.completions.parse(
+                    model=self.model,
+                    response_format=AIAnalysisResult,
+                    messages=[
+                        {
+                            "role": "system",
+                            "content": "You are an expert code reviewer. Analyze the provided code and identify issues. Respond only with the structured JSON as requested.",
+                        },
+                        {"role": "user", "content": prompt},
+                    ],
+                )
+            response = completion.choices[0].message.parsed
+            if response is None:
+                logger.warning(
+                    f"LLM returned no structured result for {file_path}: "
+                    f"{completion.choices[0].message.refusal}"
+                )
+                return []
 
-            # Convert Pydantic models to dictionaries for consistent output
-            validated_issues = [issue.model_dump() for issue in response.issues]
-
-            logger.info(
-                f"LLM analysis for {file_path} found {len(validated_issues)} issues."
-            )
-            return validated_issues
+            # Convert Pydantic models to dictionaries for consistent output,
+            # serializing the whole result in one pass
+            return response.model_dump(mode="python")["issues"]
 
         except Exception as e:
             logger.error(f"Error during LLM API call for {file_path}: {e}")
             return []
 
+    def encode(self, text: str) -> Optional[List[int]]:
+        """
+        Encode text into prompt tokens, or None when no tokenizer is loaded.
+        """
+        if self._enc is None:
+            return None
+        return self._enc.encode(text)
+
+    def count_tokens(self, text: str, tokens: Optional[List[int]] = None) -> int:
+        """
+        Count prompt tokens in text, approximating when no tokenizer is loaded.
+        """
+        if tokens is None:
+            tokens = self.encode(text)
+        if tokens is None:
+            return len(text) // 4
+        return len(tokens)
+
+    def _split_into_chunks(
+        self, code_content: str, tokens: Optional[List[int]] = None
+    ) -> List[Tuple[int, str]]:
+        """
+        Split code into overlapping token windows that fit the prompt budget.
+
+        Args:
+            code_content: The content to split.
+            tokens: The content already encoded with `encode`, if available.
+
+        Returns:
+            A list of (line_offset, chunk) tuples, where line_offset is the
+            number of lines preceding the chunk in the original content.
+        """
+        if self._enc is None:
+            return [(0, code_content)]
+
+        max_tokens = self.settings.llm.max_prompt_tokens
+        if tokens is None:
+            tokens = self._enc.encode(code_content)
+        if len(tokens) <= max_tokens:
+            return [(0, code_content)]
+
+        step = max(max_tokens - self.settings.llm.chunk_overlap_tokens, 1)
+        chunks = []
+        line_offset = 0
+        previous_start = 0
+        for start in range(0, len(tokens), step):
+            line_offset += self._enc.decode(tokens[previous_start:start]).count("\n")
+            previous_start = start
+            chunks.append(
+                (line_offset, self._enc.decode(tokens[start : start + max_tokens]))
+            )
+            if start + max_tokens >= len(tokens):
+                break
+        return chunks
+
+    @staticmethod
+    def _generated_header(code_content: str) -> Optional[str]:
+        """
+        Find a generated-code marker in the comment lines heading a file.
+
+        Returns:
+            The matching header line, or None when the file is hand-written.
+        """
+        for line in code_content[:_GENERATED_HEADER_SIZE].splitlines():
+            line = line.strip()
+            if not line or line.startswith("#!"):
+                continue
+            if not line.startswith(_COMMENT_PREFIXES):
+                break
+
+            text = line.lstrip("#/*-;<! ").removesuffix("-->").removesuffix("*/")
+            text = text.strip()
+            if _GENERATED_TAG_RE.search(text) or _GO_GENERATED_RE.match(text):
+                return text
+        return None
+
+    @classmethod
+    def _skip_reason(cls, code_content: str) -> Optional[str]:
+        """
+        Explain why a file is generated or minified and not worth reviewing.
+
+        Returns:
+            The reason to skip the file, or None when it should be analyzed.
+        """
+        header = cls._generated_header(code_content)
+        if header:
+            return f"generated file ({header!r})"
+
+        line_count = code_content.count("\n") + 1
+        avg_line_length = len(code_content) / line_count
+        if avg_line_length > _MINIFIED_AVG_LINE_LENGTH:
+            return f"minified file (average line length {avg_line_length:.0f})"
+        return None
+
     def _create_prompt(
         self, file_path: str, code_content: str, analysis_type: str
     ) -> str:
@@ -140,8 +331,8 @@ class LLMService:
         **Instructions:**
         1.  Focus exclusively on identifying issues related to **{analysis_type}**.
         2.  For each issue found, provide the line number, a clear description, a suggested fix, and a severity level.
-        3.  The `type` must be one of: {", ".join([e.value for e in IssueType])}.
-        4.  The `severity` must be one of: {", ".join([e.value for e in IssueSeverity])}.
+        3.  The `type` must be one of: {self._ISSUE_TYPES_STR}.
+        4.  The `severity` must be one of: {self._SEVERITIES_STR}.
         5.  If no issues are found, return an empty list of issues.
         """
 
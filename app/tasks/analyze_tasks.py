@@ -5,15 +5,22 @@ Contains async tasks for processing GitHub PR analysis with real GitHub integrat
 """
 
 import asyncio
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from functools import lru_cache
+from typing import Dict, Any, Optional
 from uuid import UUID
-import os
+
+from celery.exceptions import Retry
+from sqlalchemy import delete, func, insert, text, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.tasks.celery_app import celery
-from app.services.github import GitHubService
+from app.services.github import AsyncGitHubService, GitHubService
 from app.utils.language_detection import LanguageDetector
 from app.config.database import get_database_manager
+from app.config.settings import get_settings
 from app.agents.analyzer import LangGraphAnalyzer
 from app.models.database import (
     AnalysisTask,
@@ -28,27 +35,136 @@ from app.utils.exceptions import (
     RateLimitExceededException,
 )
 
+# Files with more changed lines than this are skipped as too large to review
+MAX_FILE_CHANGES = 1000
+
+# GitHub clients kept per worker process, one per distinct token
+GITHUB_SERVICE_CACHE_SIZE = 32
+
+# File results buffered before they are written while analysis is running
+RESULT_FLUSH_BATCH_SIZE = 32
+
+# Result rows can be regenerated by re-running the task, so their commits
+# don't wait for the WAL flush; PostgreSQL's WAL writer then flushes commits
+# from concurrent workers together
+_ASYNC_COMMIT = text("SET LOCAL synchronous_commit = off")
+
+# AnalysisSummary count columns and the breakdown keys they fall back to
+_SEVERITY_FIELDS = {
+    "critical_issues": "critical",
+    "high_issues": "high",
+    "medium_issues": "medium",
+    "low_issues": "low",
+}
+_ISSUE_TYPE_FIELDS = {
+    "style_issues": "style",
+    "bug_issues": "bug",
+    "performance_issues": "performance",
+    "security_issues": "security",
+    "maintainability_issues": "maintainability",
+    "best_practice_issues": "best_practice",
+}
 
 _worker_loop: Optional[asyncio.AbstractEventLoop] = None
+_language_detector = LanguageDetector()
+
+
+@lru_cache(maxsize=GITHUB_SERVICE_CACHE_SIZE)
+def _github_service_for(github_token: Optional[str]) -> GitHubService:
+    """
+    Get the worker's GitHub service for a token.
+
+    Reusing the service across tasks keeps its HTTP and Redis connection
+    pools warm instead of reconnecting for every PR.
+
+    Args:
+        github_token: GitHub token the task was submitted with
+
+    Returns:
+        Shared GitHubService for that token
+    """
+    return GitHubService(github_token)
+
+
+def _ensure_rate_budget(
+    remaining: Optional[int],
+    reset: Optional[datetime],
+    needed: int,
+    limit: Optional[int] = None,
+) -> Optional[int]:
+    """
+    Check the GitHub rate limit leaves room for the requests still to be made.
+
+    Args:
+        remaining: Requests left in the current window, None if unknown
+        reset: When the current window resets
+        needed: Requests the rest of the task is expected to make
+        limit: Requests allowed per window, None if unknown
+
+    Returns:
+        Seconds to wait before retrying, or None if the budget suffices
+
+    Raises:
+        RateLimitExceededException: If even a full window cannot cover the
+            requests, so waiting for a reset would retry forever
+    """
+    if remaining is None or remaining >= needed:
+        return None
+    if limit is not None and needed > limit:
+        raise RateLimitExceededException(
+            f"Fetching the changed files needs {needed} GitHub requests, but the "
+            f"rate limit only allows {limit} per window; "
+            "provide a GitHub token to analyze this pull request",
+            details={"needed": needed, "limit": limit},
+        )
+    wait = (reset - datetime.now()).total_seconds() if reset else 0
+    return max(60, int(wait))
+
+
+def _fetch_skip_reason(file_info: Dict[str, Any]) -> Optional[str]:
+    """
+    Decide from PR file metadata alone whether a file's content is worth fetching.
+
+    Args:
+        file_info: Changed-file entry from the PR file list
+
+    Returns:
+        Reason the file is skipped, or None if it should be fetched
+    """
+    if file_info.get("status") == "removed":
+        return "removed"
+    if file_info.get("additions", 0) + file_info.get("deletions", 0) > MAX_FILE_CHANGES:
+        return "too large"
+    return GitHubService.skip_reason(file_info["filename"])
 
 
 def run_async_in_celery(coro):
     """
     Run a coroutine on a persistent event loop owned by the worker process.
 
-    Reusing a single loop keeps asyncpg connections bound to one loop across the
-    many async calls in a task, avoiding cross-loop errors in Celery's prefork
-    workers (where each child executes one task at a time).
+    Reusing a single loop keeps pooled asyncpg connections bound to one loop
+    across tasks, avoiding cross-loop errors in Celery's prefork workers (where
+    each child executes one task at a time). The loop's default executor, used
+    by asyncio.to_thread, is sized from settings.celery.thread_pool_size.
     """
     global _worker_loop
     if _worker_loop is None or _worker_loop.is_closed():
         _worker_loop = asyncio.new_event_loop()
+        _worker_loop.set_default_executor(
+            ThreadPoolExecutor(
+                max_workers=get_settings().celery.thread_pool_size,
+                thread_name_prefix="celery-async",
+            )
+        )
         asyncio.set_event_loop(_worker_loop)
     return _worker_loop.run_until_complete(coro)
 
 
 async def update_task_status(
-    task_id: UUID, status: TaskStatus, progress: float, message: str = None
+    task_id: UUID,
+    status: TaskStatus,
+    progress: Optional[float],
+    message: Optional[str] = None,
 ) -> None:
     """
     Update task status in database using proper async SQLModel operations.
@@ -56,111 +172,218 @@ async def update_task_status(
     Args:
         task_id: Task UUID
         status: New task status
-        progress: Progress percentage
-        message: Optional status message
+        progress: Progress percentage, None to keep the current progress
+        message: Shown as the task's error_message: the failure, or why a
+            running task is waiting; None clears an earlier message
     """
+    values: Dict[str, Any] = {"status": status, "error_message": message}
+    if progress is not None:
+        values["progress"] = progress
+
+    # Timestamps come from the database clock, so durations never mix worker
+    # and server time; progress-only updates leave them alone
+    if status == TaskStatus.PROCESSING:
+        values["started_at"] = func.coalesce(AnalysisTask.started_at, func.now())
+    elif status in [TaskStatus.COMPLETED, TaskStatus.FAILED]:
+        values["completed_at"] = func.now()
+
     try:
         db_manager = get_database_manager()
-        if not db_manager._initialized:
-            db_manager.initialize()
 
         async with db_manager.get_session() as session:
-            task = await session.get(AnalysisTask, task_id)
-            if task:
-                task.status = status
-                task.progress = progress
-
-                # Handle datetime fields properly (using naive datetimes)
-                now = datetime.now()  # This creates a naive datetime
-
-                if status == TaskStatus.PROCESSING and not task.started_at:
-                    task.started_at = now
-                elif status in [TaskStatus.COMPLETED, TaskStatus.FAILED]:
-                    task.completed_at = now
-
-                if message:
-                    task.error_message = (
-                        message if status == TaskStatus.FAILED else None
-                    )
+            # A failed task keeps no partial results from batches flushed
+            # before the failure
+            if status == TaskStatus.FAILED:
+                await _delete_file_results(session, task_id)
+            result = await session.execute(
+                update(AnalysisTask).where(AnalysisTask.id == task_id).values(**values)
+            )
+            await session.commit()
 
-                await session.commit()
-                logger.debug(f"Updated task {task_id} status to {status}")
-            else:
-                logger.warning(f"Task {task_id} not found for status update")
+        if result.rowcount:
+            logger.debug(f"Updated task {task_id} status to {status}")
+        else:
+            logger.warning(f"Task {task_id} not found for status update")
 
     except Exception as e:
         logger.error(f"Failed to update task status: {e}")
 
 
+def _summary_fields(summary_in: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Map an analysis summary onto AnalysisSummary columns.
+
+    Explicit summary values win; issue counts fall back to the severity and
+    issue type breakdowns, and the remaining columns to their legacy names.
+
+    Args:
+        summary_in: Summary produced by the analysis workflow
+
+    Returns:
+        AnalysisSummary keyword arguments (without task_id)
+    """
+    severities = summary_in.get("severity_breakdown", {}) or {}
+    issue_types = summary_in.get("issue_type_breakdown", {}) or {}
+
+    defaults = {
+        "total_files": summary_in.get("total_files_analyzed", 0),
+        "total_issues": 0,
+        "code_quality_score": summary_in.get("overall_score", 0.0),
+        "maintainability_score": 0.0,
+    }
+    defaults.update(
+        (field, severities.get(key, 0)) for field, key in _SEVERITY_FIELDS.items()
+    )
+    defaults.update(
+        (field, issue_types.get(key, 0)) for field, key in _ISSUE_TYPE_FIELDS.items()
+    )
+    return {field: summary_in.get(field, value) for field, value in defaults.items()}
+
+
+async def _insert_file_results(
+    session: AsyncSession, task_id: UUID, files: Dict[str, Dict[str, Any]]
+) -> None:
+    """
+    Bulk-insert one AnalysisResult row per file in a single executemany round-trip.
+
+    Args:
+        session: Open database session; the caller commits
+        task_id: Task UUID
+        files: File analyses keyed by file path
+    """
+    # created_at is left out so the column's server default stamps it
+    rows = [
+        AnalysisResult(
+            task_id=task_id,
+            file_name=file_path.rpartition("/")[2],
+            file_path=file_path,
+            file_size=file_analysis.get("size", 0),
+            language=file_analysis.get("language", "unknown"),
+            issues=file_analysis.get("issues", []),
+        ).model_dump(exclude={"created_at"})
+        for file_path, file_analysis in files.items()
+    ]
+    if rows:
+        await session.execute(insert(AnalysisResult), rows)
+
+
+async def _delete_file_results(session: AsyncSession, task_id: UUID) -> None:
+    """
+    Delete every AnalysisResult row stored for a task.
+
+    Args:
+        session: Open database session; the caller commits
+        task_id: Task UUID
+    """
+    await session.execute(
+        delete(AnalysisResult).where(AnalysisResult.task_id == task_id)
+    )
+
+
+class FileResultWriter:
+    """
+    Persists file analyses in batches while the analysis is still running.
+
+    Results become durable (and visible to the API) every
+    RESULT_FLUSH_BATCH_SIZE files instead of all at once at the end.
+    Whatever is still pending is written by save_analysis_results together
+    with the summary.
+
+    The first write of a run replaces any rows left by an earlier, interrupted
+    run of the same task (a worker crash or a retry), so results are never
+    duplicated.
+    """
+
+    def __init__(self, task_id: UUID, batch_size: int = RESULT_FLUSH_BATCH_SIZE):
+        """
+        Initialize an empty writer for a task.
+
+        Args:
+            task_id: Task UUID
+            batch_size: Number of files buffered before a flush
+        """
+        self.task_id = task_id
+        self.batch_size = batch_size
+        self.pending: Dict[str, Dict[str, Any]] = {}
+        self.cleared = False
+        # Parallel analysis queues flush concurrently; the first flush's DELETE
+        # must commit before any other batch is written
+        self._flush_lock = asyncio.Lock()
+
+    async def add(self, file_path: str, file_analysis: Dict[str, Any]) -> None:
+        """Buffer one file's analysis, flushing once the batch is full."""
+        self.pending[file_path] = file_analysis
+        if len(self.pending) >= self.batch_size:
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Write all buffered analyses in one transaction."""
+        # Swap the buffer first: other analyses keep arriving while we await
+        batch, self.pending = self.pending, {}
+        if not batch:
+            return
+
+        async with self._flush_lock:
+            async with get_database_manager().get_session() as session:
+                await session.execute(_ASYNC_COMMIT)
+                if not self.cleared:
+                    await _delete_file_results(session, self.task_id)
+                await _insert_file_results(session, self.task_id, batch)
+                await session.commit()
+            self.cleared = True
+        logger.debug(f"Flushed {len(batch)} file results for task {self.task_id}")
+
+
 async def save_analysis_results(
-    task_id: UUID, analysis_results: Dict[str, Any], pr_metadata: Dict[str, Any]
+    task_id: UUID,
+    analysis_results: Dict[str, Any],
+    pr_metadata: Dict[str, Any],
+    clear_existing: bool = True,
 ) -> None:
     """
-    Save analysis results to database using proper async SQLModel operations.
+    Save analysis results and mark the task completed in one transaction.
+
+    The commit is synchronous, so the completion is durable; flushing its WAL
+    record also makes the batches FileResultWriter committed asynchronously
+    durable.
 
     Args:
         task_id: Task UUID
         analysis_results: Analysis results data
         pr_metadata: Pull request metadata
+        clear_existing: Delete the task's stored file results first; False
+            when this run has already replaced them
     """
     try:
         db_manager = get_database_manager()
-        if not db_manager._initialized:
-            db_manager.initialize()
 
         async with db_manager.get_session() as session:
-            # Create analysis results for each file
-            for file_path, file_analysis in analysis_results.get("files", {}).items():
-                file_name = os.path.basename(file_path)
-
-                analysis_result = AnalysisResult(
-                    task_id=task_id,
-                    file_name=file_name,
-                    file_path=file_path,
-                    file_size=file_analysis.get("size", 0),
-                    language=file_analysis.get("language", "unknown"),
-                    issues=file_analysis.get("issues", []),
-                )
-                session.add(analysis_result)
-
-            # Create task summary with fallbacks from breakdowns
-            summary_in = analysis_results.get("summary", {}) or {}
-            sev = summary_in.get("severity_breakdown", {}) or {}
-            typ = summary_in.get("issue_type_breakdown", {}) or {}
+            if clear_existing:
+                await _delete_file_results(session, task_id)
+            await _insert_file_results(
+                session, task_id, analysis_results.get("files", {})
+            )
 
             summary = AnalysisSummary(
                 task_id=task_id,
-                total_files=summary_in.get(
-                    "total_files", summary_in.get("total_files_analyzed", 0)
-                ),
-                total_issues=summary_in.get("total_issues", 0),
-                critical_issues=summary_in.get(
-                    "critical_issues", sev.get("critical", 0)
-                ),
-                high_issues=summary_in.get("high_issues", sev.get("high", 0)),
-                medium_issues=summary_in.get("medium_issues", sev.get("medium", 0)),
-                low_issues=summary_in.get("low_issues", sev.get("low", 0)),
-                style_issues=summary_in.get("style_issues", typ.get("style", 0)),
-                bug_issues=summary_in.get("bug_issues", typ.get("bug", 0)),
-                performance_issues=summary_in.get(
-                    "performance_issues", typ.get("performance", 0)
-                ),
-                security_issues=summary_in.get(
-                    "security_issues", typ.get("security", 0)
-                ),
-                maintainability_issues=summary_in.get(
-                    "maintainability_issues", typ.get("maintainability", 0)
-                ),
-                best_practice_issues=summary_in.get(
-                    "best_practice_issues", typ.get("best_practice", 0)
-                ),
-                code_quality_score=summary_in.get(
-                    "code_quality_score", summary_in.get("overall_score", 0.0)
-                ),
-                maintainability_score=summary_in.get("maintainability_score", 0.0),
+                **_summary_fields(analysis_results.get("summary", {}) or {}),
             )
             session.add(summary)
 
+            # Completing in the same commit means the API never sees a
+            # completed task without its results, and a failed save leaves
+            # no summary behind
+            await session.execute(
+                update(AnalysisTask)
+                .where(AnalysisTask.id == task_id)
+                .values(
+                    status=TaskStatus.COMPLETED,
+                    progress=100.0,
+                    completed_at=func.now(),
+                    error_message=None,
+                )
+            )
+
             await session.commit()
             logger.info(f"Saved analysis results for task {task_id}")
 
@@ -185,156 +408,161 @@ def analyze_pr_task(
     Returns:
         dict: Analysis results
     """
+    return run_async_in_celery(
+        _analyze_pr(self, task_id, repo_url, pr_number, github_token)
+    )
+
+
+async def _analyze_pr(
+    celery_task, task_id: str, repo_url: str, pr_number: int, github_token: str
+) -> Dict[str, Any]:
+    """
+    Run the whole PR analysis as one coroutine on the worker's event loop.
+
+    Blocking GitHub calls are offloaded to threads, so status updates and
+    database writes share the loop without a round-trip per call. The task row
+    is written only on state transitions (started, completed or failed);
+    progress in between goes to the Celery result backend.
+    """
     task_uuid = UUID(task_id)
 
     try:
         logger.info(f"Starting analysis for PR #{pr_number} from {repo_url}")
 
         # Update task status to processing
-        run_async_in_celery(
-            update_task_status(
-                task_uuid, TaskStatus.PROCESSING, 0.0, "Starting analysis..."
-            )
-        )
+        await update_task_status(task_uuid, TaskStatus.PROCESSING, 0.0)
 
         # Initialize services
-        github_service = GitHubService(github_token)
-        language_detector = LanguageDetector()
+        github_service = AsyncGitHubService(_github_service_for(github_token))
         # Initialize LangGraph analyzer
         langgraph_analyzer = LangGraphAnalyzer()
 
-        # Fetch PR metadata
-        self.update_state(
+        # Fetch PR metadata and changed files together
+        celery_task.update_state(
             state="PROGRESS",
             meta={
                 "current": 10,
                 "total": 100,
-                "status": "Fetching PR metadata...",
+                "status": "Fetching PR metadata and changed files...",
                 "task_id": task_id,
             },
         )
 
-        pr_metadata = github_service.get_pull_request_metadata(repo_url, pr_number)
-        run_async_in_celery(
-            update_task_status(
-                task_uuid, TaskStatus.PROCESSING, 10.0, "PR metadata fetched"
-            )
-        )
+        pr_bundle = await github_service.get_pull_request_bundle(repo_url, pr_number)
+        pr_metadata = pr_bundle["metadata"]
 
         logger.info(f"Fetched metadata for PR: '{pr_metadata['title']}'")
 
         # Check if PR is analyzable
         if pr_metadata["state"] not in ["open", "closed"]:
-            run_async_in_celery(
-                update_task_status(
-                    task_uuid,
-                    TaskStatus.FAILED,
-                    0.0,
-                    f"PR is in '{pr_metadata['state']}' state",
-                )
+            await update_task_status(
+                task_uuid,
+                TaskStatus.FAILED,
+                0.0,
+                f"PR is in '{pr_metadata['state']}' state",
             )
             return {"error": f"PR is in '{pr_metadata['state']}' state"}
 
-        # Fetch PR files
-        self.update_state(
+        files = pr_bundle["files"]["files"]
+        file_count = len(files)
+
+        celery_task.update_state(
             state="PROGRESS",
             meta={
                 "current": 30,
                 "total": 100,
-                "status": "Fetching changed files...",
+                "status": f"Found {file_count} files to analyze",
                 "task_id": task_id,
             },
         )
 
-        pr_files_data = github_service.get_pull_request_files(repo_url, pr_number)
-        files = pr_files_data["files"]
-        file_count = len(files)
-
-        run_async_in_celery(
-            update_task_status(
-                task_uuid,
-                TaskStatus.PROCESSING,
-                30.0,
-                f"Found {file_count} files to analyze",
-            )
-        )
-
         logger.info(f"Found {file_count} files to analyze")
 
         if file_count == 0:
-            run_async_in_celery(
-                update_task_status(
-                    task_uuid, TaskStatus.COMPLETED, 100.0, "No files to analyze"
-                )
-            )
+            await update_task_status(task_uuid, TaskStatus.COMPLETED, 100.0)
             return {"message": "No files to analyze", "files": []}
 
         # File content lives on the PR's head repository (a fork for cross-repo PRs)
         content_repo_url = f"https://github.com/{pr_metadata['head']['repo']}"
         head_sha = pr_metadata["head"]["sha"]
 
+        # Drop files not worth analyzing before fetching anything
+        candidate_files = []
+        skipped: Counter = Counter()
+        for file_info in files:
+            reason = _fetch_skip_reason(file_info)
+            if reason:
+                skipped[reason] += 1
+            else:
+                candidate_files.append(file_info)
+
+        # Retry once the window resets rather than failing halfway through
+        countdown = _ensure_rate_budget(
+            github_service.rate_limit_remaining,
+            github_service.rate_limit_reset,
+            github_service.content_fetch_cost(len(candidate_files)),
+            github_service.rate_limit_limit,
+        )
+        if countdown is not None:
+            logger.warning(
+                f"GitHub rate limit too low for PR #{pr_number}, "
+                f"retrying in {countdown}s"
+            )
+            await update_task_status(
+                task_uuid,
+                TaskStatus.PROCESSING,
+                None,
+                f"Awaiting GitHub rate limit reset, retrying in {countdown}s",
+            )
+            raise celery_task.retry(countdown=countdown)
+
+        celery_task.update_state(
+            state="PROGRESS",
+            meta={
+                "current": 50,
+                "total": 100,
+                "status": f"Fetching content of {len(candidate_files)} files...",
+                "task_id": task_id,
+            },
+        )
+
+        # Fetch all file contents in batched requests
+        contents = await github_service.get_files_content_batch(
+            content_repo_url,
+            [file_info["filename"] for file_info in candidate_files],
+            head_sha,
+        )
+
         # Collect file contents for AI analysis
         files_for_analysis = []
         analyzed_count = 0
 
-        logger.info(f"Processing {file_count} files for analysis")
+        logger.info(f"Processing {len(candidate_files)} files for analysis")
 
-        for i, file_info in enumerate(files):
+        for file_info in candidate_files:
             file_path = file_info["filename"]
 
-            logger.debug(f"Processing file {i + 1}/{file_count}: {file_path}")
-
-            # Update progress
-            progress = 30 + (i / file_count) * 50  # 30-80% for file collection
-            self.update_state(
-                state="PROGRESS",
-                meta={
-                    "current": int(progress),
-                    "total": 100,
-                    "status": f"Processing {file_path}...",
-                    "task_id": task_id,
-                },
-            )
-
             try:
-                # Skip very large files or binary files
-                if file_info.get("additions", 0) + file_info.get("deletions", 0) > 1000:
-                    logger.info(f"Skipping large file: {file_path}")
+                file_content_data = contents.get(file_path)
+                if file_content_data is None:
+                    # Skip files we can't read
+                    skipped["unreadable"] += 1
                     continue
 
-                # Detect language
-                language = language_detector.detect_language_from_filename(file_path)
+                # Skip binary files
+                if not file_content_data.get("is_text", True):
+                    skipped["binary"] += 1
+                    continue
 
-                # Get file content
-                try:
-                    file_content_data = github_service.get_file_content(
-                        content_repo_url, file_path, head_sha
-                    )
+                file_content = file_content_data.get("content") or ""
 
-                    # Extract the actual text content from the response
-                    file_content = (
-                        file_content_data.get("content", "")
-                        if isinstance(file_content_data, dict)
-                        else str(file_content_data)
+                # Detect language, falling back to content if still unknown
+                language = _language_detector.detect_language_from_filename(file_path)
+                if not language and file_content:
+                    language = _language_detector.detect_language_from_content(
+                        file_content
                     )
 
-                    # Skip binary files
-                    if not file_content_data.get("is_text", True):
-                        logger.info(f"Skipping binary file: {file_path}")
-                        continue
-
-                    # Try to detect language from content if still unknown
-                    if not language and file_content:
-                        language = language_detector.detect_language_from_content(
-                            file_content
-                        )
-
-                except Exception as e:
-                    logger.warning(f"Could not fetch content for {file_path}: {e}")
-                    file_content = ""
-                    # Skip files we can't read
-                    continue
-
                 # Add to analysis list
                 files_for_analysis.append(
                     {
@@ -351,14 +579,15 @@ def analyze_pr_task(
             except Exception as e:
                 logger.error(f"Error processing file {file_path}: {e}")
 
-        # Run LangGraph analysis
-        run_async_in_celery(
-            update_task_status(
-                task_uuid, TaskStatus.PROCESSING, 80.0, "Running AI analysis..."
+        # One line per task instead of one per skipped file
+        if skipped:
+            logger.info(
+                f"Skipped {sum(skipped.values())} of {file_count} files: "
+                + ", ".join(f"{count} {reason}" for reason, count in skipped.items())
             )
-        )
 
-        self.update_state(
+        # Run LangGraph analysis
+        celery_task.update_state(
             state="PROGRESS",
             meta={
                 "current": 85,
@@ -369,8 +598,9 @@ def analyze_pr_task(
         )
 
         try:
-            analysis_results = run_async_in_celery(
-                langgraph_analyzer.analyze_pr(pr_metadata, files_for_analysis)
+            result_writer = FileResultWriter(task_uuid)
+            analysis_results = await langgraph_analyzer.analyze_pr(
+                pr_metadata, files_for_analysis, result_writer.add
             )
 
             # Check if the analysis returned an error result
@@ -381,9 +611,7 @@ def analyze_pr_task(
                 logger.error(f"AI Agent analysis returned error result: {error_msg}")
 
                 # Mark task as failed with proper error message
-                run_async_in_celery(
-                    update_task_status(task_uuid, TaskStatus.FAILED, 0.0, error_msg)
-                )
+                await update_task_status(task_uuid, TaskStatus.FAILED, 0.0, error_msg)
                 return {"error": error_msg, "task_id": task_id}
             else:
                 logger.info("AI Agent analysis completed successfully")
@@ -393,16 +621,18 @@ def analyze_pr_task(
             logger.error(f"LangGraph analysis failed: {e}", exc_info=True)
 
             # Mark task as failed with proper error message
-            run_async_in_celery(
-                update_task_status(task_uuid, TaskStatus.FAILED, 0.0, error_msg)
-            )
+            await update_task_status(task_uuid, TaskStatus.FAILED, 0.0, error_msg)
             return {"error": error_msg, "task_id": task_id}
 
         # Update progress after analysis
-        run_async_in_celery(
-            update_task_status(
-                task_uuid, TaskStatus.PROCESSING, 90.0, "Saving results..."
-            )
+        celery_task.update_state(
+            state="PROGRESS",
+            meta={
+                "current": 90,
+                "total": 100,
+                "status": "Saving results...",
+                "task_id": task_id,
+            },
         )
 
         # Extract summary from analysis results
@@ -410,19 +640,13 @@ def analyze_pr_task(
         summary["total_files"] = file_count
         summary["files_analyzed"] = analyzed_count
 
-        # Save results to database
-        database_results = adapt_analysis_results_for_database(
-            analysis_results, files_for_analysis
-        )
-        run_async_in_celery(
-            save_analysis_results(task_uuid, database_results, pr_metadata)
-        )
-
-        # Mark task as completed
-        run_async_in_celery(
-            update_task_status(
-                task_uuid, TaskStatus.COMPLETED, 100.0, "Analysis completed"
-            )
+        # Save the last partial batch and the summary, which also marks the
+        # task as completed
+        await save_analysis_results(
+            task_uuid,
+            {"files": result_writer.pending, "summary": summary},
+            pr_metadata,
+            clear_existing=not result_writer.cleared,
         )
 
         logger.info(f"Analysis completed for PR #{pr_number}")
@@ -436,6 +660,9 @@ def analyze_pr_task(
             ),
         }
 
+    except Retry:
+        raise
+
     except (
         GitHubAPIException,
         InvalidRepositoryException,
@@ -445,9 +672,7 @@ def analyze_pr_task(
         error_msg = f"GitHub API error: {str(e)}"
         logger.error(error_msg)
 
-        run_async_in_celery(
-            update_task_status(task_uuid, TaskStatus.FAILED, 0.0, error_msg)
-        )
+        await update_task_status(task_uuid, TaskStatus.FAILED, 0.0, error_msg)
 
         return {"error": error_msg, "task_id": task_id}
 
@@ -456,29 +681,6 @@ def analyze_pr_task(
         error_msg = f"Unexpected error during analysis: {str(exc)}"
         logger.error(error_msg, exc_info=True)
 
-        run_async_in_celery(
-            update_task_status(task_uuid, TaskStatus.FAILED, 0.0, error_msg)
-        )
+        await update_task_status(task_uuid, TaskStatus.FAILED, 0.0, error_msg)
 
         raise exc  # Re-raise for Celery to handle
-
-
-def adapt_analysis_results_for_database(
-    analysis_results: Dict[str, Any], files_data: List[Dict[str, Any]]
-) -> Dict[str, Any]:
-    """
-    Adapt analysis results from the intelligent workflow to the database format.
-
-    Args:
-        analysis_results: Results from the intelligent workflow.
-        files_data: Original files data (not used in this adapter but kept for signature consistency).
-
-    Returns:
-        A dictionary with 'files' and 'summary' keys, formatted for database saving.
-    """
-    # The new workflow already returns data in a compatible format.
-    # This function now primarily acts as a pass-through and validation step.
-    return {
-        "files": analysis_results.get("files", {}),
-        "summary": analysis_results.get("summary", {}),
-    }
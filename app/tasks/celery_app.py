@@ -4,8 +4,10 @@ Celery Application Configuration
 Configures Celery for asynchronous task processing.
 """
 
+import orjson
 from celery import Celery
 from celery.signals import worker_init
+from kombu.serialization import register
 
 from app.config.settings import get_settings
 
@@ -21,11 +23,22 @@ celery = Celery(
 )
 
 
+# orjson-backed JSON for task messages and results; plain "json" is still
+# accepted so messages queued by older producers keep working
+register(
+    "orjson",
+    lambda obj: orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS),
+    orjson.loads,
+    content_type="application/x-orjson",
+    content_encoding="utf-8",
+)
+
+
 # Celery configuration from settings
 celery.conf.update(
-    task_serializer="json",
-    accept_content=["json"],
-    result_serializer="json",
+    task_serializer="orjson",
+    accept_content=["orjson", "json"],
+    result_serializer="orjson",
     timezone="UTC",
     enable_utc=True,
     task_track_started=True,
@@ -50,7 +63,13 @@ celery.conf.update(
 
 @worker_init.connect
 def init_worker(**kwargs):
-    """Initialize database connection when worker starts"""
+    """
+    Initialize database connection when worker starts.
+
+    Tasks rely on this and do not re-check initialization per call. The pool
+    opens no connections until first use, so prefork children inherit an
+    engine with no sockets to share.
+    """
     from app.config.database import db_manager
     from app.utils.logger import logger
 
@@ -4,13 +4,15 @@ Application Exceptions and Handlers
 Custom exceptions and FastAPI exception handlers for the Code Reviewer Agent.
 """
 
-from datetime import datetime, timezone
+from time import gmtime, strftime
 
 from fastapi import HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.exc import SQLAlchemyError
 from pydantic import ValidationError
 
+from app.utils.logger import logger
+
 
 class CodeReviewerException(Exception):
     """Base exception for all application-specific errors."""
@@ -115,12 +117,15 @@ class RateLimitExceededException(CodeReviewerException):
 # Exception Handlers
 
 
+def _utc_timestamp() -> str:
+    """Current UTC time as an ISO 8601 string, e.g. 2025-01-01T12:00:00Z."""
+    return strftime("%Y-%m-%dT%H:%M:%SZ", gmtime())
+
+
 async def code_reviewer_exception_handler(
     request: Request, exc: CodeReviewerException
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Handle application-specific exceptions."""
-    from app.utils.logger import logger
-
     logger.warning(
         f"Application exception: {exc.message}",
         extra={
@@ -143,22 +148,22 @@ async def code_reviewer_exception_handler(
     ):
         headers["Retry-After"] = str(exc.retry_after)
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status_code,
         content={
             "error": exc.message,
             "error_code": exc.error_code,
             "details": exc.details,
-            "timestamp": datetime.now(timezone.utc).isoformat() + "Z",
+            "timestamp": _utc_timestamp(),
         },
         headers=headers if headers else None,
     )
 
 
-async def http_exception_handler(request: Request, exc: HTTPException) -> JSONResponse:
+async def http_exception_handler(
+    request: Request, exc: HTTPException
+) -> ORJSONResponse:
     """Handle FastAPI HTTP exceptions."""
-    from app.utils.logger import logger
-
     logger.warning(
         f"HTTP exception: {exc.detail}",
         extra={
@@ -168,11 +173,11 @@ async def http_exception_handler(request: Request, exc: HTTPException) -> JSONRe
         },
     )
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "detail": exc.detail,
-            "timestamp": datetime.now(timezone.utc).isoformat() + "Z",
+            "timestamp": _utc_timestamp(),
         },
         headers=getattr(exc, "headers", None),
     )
@@ -180,10 +185,8 @@ async def http_exception_handler(request: Request, exc: HTTPException) -> JSONRe
 
 async def validation_exception_handler(
     request: Request, exc: ValidationError
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Handle Pydantic validation errors."""
-    from app.utils.logger import logger
-
     logger.warning(
         f"Validation error: {exc}",
         extra={
@@ -202,21 +205,19 @@ async def validation_exception_handler(
         for error in exc.errors()
     ]
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=422,
         content={
             "detail": errors,
-            "timestamp": datetime.now(timezone.utc).isoformat() + "Z",
+            "timestamp": _utc_timestamp(),
         },
     )
 
 
 async def database_exception_handler(
     request: Request, exc: SQLAlchemyError
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Handle SQLAlchemy database errors."""
-    from app.utils.logger import logger
-
     logger.error(
         f"Database error: {exc}",
         extra={
@@ -226,20 +227,18 @@ async def database_exception_handler(
         },
     )
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "detail": "Database operation failed",
             "error_code": "DATABASE_ERROR",
-            "timestamp": datetime.now(timezone.utc).isoformat() + "Z",
+            "timestamp": _utc_timestamp(),
         },
     )
 
 
-async def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def general_exception_handler(request: Request, exc: Exception) -> ORJSONResponse:
     """Handle all other unexpected exceptions."""
-    from app.utils.logger import logger
-
     logger.error(
         f"Unexpected error: {exc}",
         extra={
@@ -250,20 +249,18 @@ async def general_exception_handler(request: Request, exc: Exception) -> JSONRes
         exc_info=True,
     )
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "detail": "Internal server error",
             "error_code": "INTERNAL_ERROR",
-            "timestamp": datetime.now(timezone.utc).isoformat() + "Z",
+            "timestamp": _utc_timestamp(),
         },
     )
 
 
 def setup_exception_handlers(app):
     """Register all exception handlers with the FastAPI app."""
-    from app.utils.logger import logger
-
     # Application-specific exceptions
     app.add_exception_handler(CodeReviewerException, code_reviewer_exception_handler)
 
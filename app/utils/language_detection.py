@@ -4,10 +4,39 @@ Language Detection Utility
 Utilities for detecting programming languages from file names and content.
 """
 
+import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 
+def _any_of(*patterns: str, flags: int = 0) -> re.Pattern:
+    """Compile literal patterns into one alternation, so content is scanned once."""
+    return re.compile("|".join(re.escape(pattern) for pattern in patterns), flags)
+
+
+# Only the start of a file is scanned for content signatures; shebangs,
+# includes and imports appear at the top
+MAX_SCAN_CHARS = 16 * 1024
+
+# Larger files are not parsed to check whether they are JSON
+MAX_JSON_PARSE_CHARS = 1024 * 1024
+
+# Content signatures, checked in priority order by detect_language_from_content
+_PYTHON_RE = _any_of("def ", "import ", "from ", "__name__")
+_JAVASCRIPT_RE = _any_of("function ", "const ", "let ", "var ", "=>")
+_TYPESCRIPT_RE = _any_of("interface ", "type ", ": ")
+_JAVA_RE = _any_of("public class ", "private ", "public static void")
+_C_RE = _any_of("#include", "int main(", "void main(")
+_CPP_RE = _any_of("std::", "class ", "namespace ")
+_HTML_RE = _any_of("<html", "<body", "<div", "<!doctype", flags=re.IGNORECASE)
+_CSS_RE = _any_of("color:", "margin:", "padding:", "font-")
+_SQL_RE = _any_of(
+    "select ", "insert ", "update ", "delete ", "create table", flags=re.IGNORECASE
+)
+_YAML_RE = _any_of(": ", "- ", "---")
+
+
 class LanguageDetector:
     """
     Utility class for detecting programming languages from file extensions and content.
@@ -131,6 +160,26 @@ class LanguageDetector:
         "pyproject.toml": "toml",
     }
 
+    # Languages analyzed by the reviewer
+    SUPPORTED_LANGUAGES = frozenset(
+        {
+            "python",
+            "javascript",
+            "typescript",
+            "java",
+            "go",
+            "rust",
+            "cpp",
+            "c",
+            "csharp",
+            "php",
+            "ruby",
+            "swift",
+            "kotlin",
+            "scala",
+        }
+    )
+
     @classmethod
     def detect_language_from_filename(cls, filename: str) -> Optional[str]:
         """
@@ -146,17 +195,26 @@ class LanguageDetector:
             return None
 
         # Get just the filename without path
-        basename = Path(filename).name.lower()
+        basename = filename[filename.rfind("/") + 1 :].lower()
+
+        return cls._detect_language_from_basename(basename)
 
-        # Check special filename patterns first
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def _detect_language_from_basename(cls, basename: str) -> Optional[str]:
+        """Look up the language for a lowercased basename, memoized per name."""
+        # Check special filename patterns first, exact names without a scan
+        if basename in cls.FILENAME_PATTERNS:
+            return cls.FILENAME_PATTERNS[basename]
         for pattern, language in cls.FILENAME_PATTERNS.items():
             if pattern in basename:
                 return language
 
-        # Check file extension
-        extension = Path(filename).suffix.lower()
-        if extension in cls.EXTENSION_MAP:
-            return cls.EXTENSION_MAP[extension]
+        # Check file extension; as with Path.suffix, a leading or trailing
+        # dot does not start one
+        dot = basename.rfind(".")
+        if 0 < dot < len(basename) - 1:
+            return cls.EXTENSION_MAP.get(basename[dot:])
 
         return None
 
@@ -183,10 +241,11 @@ class LanguageDetector:
             if lang:
                 return lang
 
+        head = content[:MAX_SCAN_CHARS]
+
         # Look for shebangs (Unix scripts)
-        lines = content.split("\n")
-        if lines and lines[0].startswith("#!"):
-            shebang = lines[0].lower()
+        if head.startswith("#!"):
+            shebang = head.split("\n", 1)[0].lower()
             if "python" in shebang:
                 return "python"
             elif "node" in shebang or "javascript" in shebang:
@@ -199,85 +258,64 @@ class LanguageDetector:
                 return "shell"
 
         # Look for common language patterns in content
-        content_lower = content.lower()
-
-        # Python patterns
-        if any(
-            pattern in content for pattern in ["def ", "import ", "from ", "__name__"]
-        ):
+        if _PYTHON_RE.search(head):
             return "python"
 
         # JavaScript/TypeScript patterns
-        if any(
-            pattern in content
-            for pattern in ["function ", "const ", "let ", "var ", "=>"]
-        ):
-            if "interface " in content or "type " in content or ": " in content:
+        if _JAVASCRIPT_RE.search(head):
+            if _TYPESCRIPT_RE.search(head):
                 return "typescript"
             return "javascript"
 
         # Java patterns
-        if any(
-            pattern in content
-            for pattern in ["public class ", "private ", "public static void"]
-        ):
+        if _JAVA_RE.search(head):
             return "java"
 
         # C/C++ patterns
-        if any(
-            pattern in content for pattern in ["#include", "int main(", "void main("]
-        ):
-            if any(
-                cpp_pattern in content
-                for cpp_pattern in ["std::", "class ", "namespace "]
-            ):
+        if _C_RE.search(head):
+            if _CPP_RE.search(head):
                 return "cpp"
             return "c"
 
         # PHP patterns
-        if content.startswith("<?php") or "<?php" in content:
+        if "<?php" in head:
             return "php"
 
         # HTML patterns
-        if any(
-            pattern in content_lower
-            for pattern in ["<html", "<body", "<div", "<!doctype"]
-        ):
+        if _HTML_RE.search(head):
             return "html"
 
         # CSS patterns
-        if "{" in content and "}" in content and ":" in content and ";" in content:
-            if any(
-                pattern in content
-                for pattern in ["color:", "margin:", "padding:", "font-"]
-            ):
+        if "{" in head and "}" in head and ":" in head and ";" in head:
+            if _CSS_RE.search(head):
                 return "css"
 
         # SQL patterns
-        if any(
-            pattern in content_lower
-            for pattern in ["select ", "insert ", "update ", "delete ", "create table"]
-        ):
+        if _SQL_RE.search(head):
             return "sql"
 
         # JSON pattern
-        if content.strip().startswith("{") and content.strip().endswith("}"):
+        stripped = content.strip() if len(content) <= MAX_JSON_PARSE_CHARS else ""
+        if stripped.startswith("{") and stripped.endswith("}"):
             try:
                 import json
 
-                json.loads(content)
+                json.loads(stripped)
                 return "json"
             except Exception:
                 pass
 
         # YAML patterns
-        if any(pattern in content for pattern in [": ", "- ", "---"]):
-            # Simple heuristic for YAML
-            lines = [line.strip() for line in content.split("\n") if line.strip()]
-            yaml_like = sum(
-                1 for line in lines if ": " in line or line.startswith("- ")
-            )
-            if yaml_like > len(lines) * 0.3:  # At least 30% of lines look like YAML
+        if _YAML_RE.search(head):
+            # Simple heuristic for YAML, counted in a single pass
+            total = yaml_like = 0
+            for line in head.split("\n"):
+                line = line.strip()
+                if line:
+                    total += 1
+                    if ": " in line or line.startswith("- "):
+                        yaml_like += 1
+            if yaml_like > total * 0.3:  # At least 30% of lines look like YAML
                 return "yaml"
 
         return None
@@ -296,26 +334,7 @@ class LanguageDetector:
         if not language:
             return False
 
-        # Get supported languages from config (we'll add this later)
-        # For now, use a hardcoded list of commonly analyzed languages
-        supported_languages = {
-            "python",
-            "javascript",
-            "typescript",
-            "java",
-            "go",
-            "rust",
-            "cpp",
-            "c",
-            "csharp",
-            "php",
-            "ruby",
-            "swift",
-            "kotlin",
-            "scala",
-        }
-
-        return language.lower() in supported_languages
+        return language.lower() in cls.SUPPORTED_LANGUAGES
 
     @classmethod
     def get_language_info(cls, filename: str, content: str = None) -> dict:
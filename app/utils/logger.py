@@ -24,8 +24,9 @@ def setup_logger() -> None:
         format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}:{function}:{line}</cyan> | {message}",
         level=settings.app.log_level,
         colorize=True,
-        backtrace=True,
-        diagnose=True,
+        # Extended tracebacks with variable values are costly; debug only
+        backtrace=settings.app.debug,
+        diagnose=settings.app.debug,
     )
 
     # File handler if enabled
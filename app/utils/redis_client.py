@@ -1,21 +1,54 @@
+from functools import lru_cache
+from typing import Optional
+
 import redis
 import redis.asyncio as aioredis
 from app.config.settings import get_settings
 
 settings = get_settings()
 
+_async_client: Optional[aioredis.Redis] = None
+
 
+@lru_cache(maxsize=1)
 def get_sync_redis_client():
     """
-    Provides a synchronous Redis client connection.
+    Provides the shared synchronous Redis client.
+
+    The client's connection pool is thread-safe and resets itself after a
+    fork, so one instance serves every caller in the process.
     """
-    return redis.from_url(settings.redis.url, encoding="utf-8", decode_responses=False)
+    return redis.from_url(
+        settings.redis.url,
+        encoding="utf-8",
+        decode_responses=False,
+        max_connections=settings.redis.max_connections,
+    )
 
 
 async def get_async_redis_client():
     """
-    Provides an asynchronous Redis client connection.
+    Provides the shared asynchronous Redis client, created on first use.
     """
-    return aioredis.from_url(
-        settings.redis.url, encoding="utf-8", decode_responses=True
-    )
+    global _async_client
+    if _async_client is None:
+        _async_client = aioredis.from_url(
+            settings.redis.url,
+            encoding="utf-8",
+            decode_responses=True,
+            max_connections=settings.redis.max_connections,
+        )
+    return _async_client
+
+
+async def close_redis_clients() -> None:
+    """
+    Close the shared clients' connection pools.
+    """
+    global _async_client
+    if _async_client is not None:
+        await _async_client.aclose()
+        _async_client = None
+    if get_sync_redis_client.cache_info().currsize:
+        get_sync_redis_client().close()
+        get_sync_redis_client.cache_clear()
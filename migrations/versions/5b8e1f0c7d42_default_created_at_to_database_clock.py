@@ -0,0 +1,44 @@
+"""Default created_at columns to the database clock
+
+Revision ID: 5b8e1f0c7d42
+Revises: e60ea05371b9
+Create Date: 2026-10-15 23:45:12.318204
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "5b8e1f0c7d42"
+down_revision: Union[str, Sequence[str], None] = "e60ea05371b9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_TABLES = ("analysis_tasks", "analysis_results", "analysis_summaries")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in _TABLES:
+        op.alter_column(
+            table,
+            "created_at",
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            server_default=sa.func.now(),
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in _TABLES:
+        op.alter_column(
+            table,
+            "created_at",
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            server_default=None,
+        )
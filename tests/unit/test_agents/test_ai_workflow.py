@@ -0,0 +1,183 @@
+"""Tests for the AI analysis workflow."""
+
+import asyncio
+import pytest
+from unittest.mock import Mock, patch
+
+from app.agents.ai_workflow import AIWorkflow, balance_by_weight
+
+
+class TestBalanceByWeight:
+    """Test balance_by_weight scheduling helper."""
+
+    def test_heaviest_items_spread_across_workers(self):
+        """Test queues end up with similar total weight."""
+        items = ["a", "b", "c", "d", "e"]
+        weights = [10, 1, 7, 3, 5]
+
+        queues = balance_by_weight(items, weights, 2)
+
+        loads = sorted(sum(weights[items.index(i)] for i in q) for q in queues)
+        assert loads == [13, 13]
+        assert sorted(i for q in queues for i in q) == items
+
+    def test_fewer_items_than_workers(self):
+        """Test empty queues are not returned."""
+        assert balance_by_weight(["a"], [5], 4) == [["a"]]
+
+    def test_no_items(self):
+        """Test no queues are returned for no items."""
+        assert balance_by_weight([], [], 3) == []
+
+
+class TestAIWorkflow:
+    """Test AIWorkflow file analysis."""
+
+    @pytest.mark.asyncio
+    async def test_file_analysis_runs_concurrently_in_triage_order(self):
+        """Test files are analyzed concurrently and reported in triage order."""
+        workflow = AIWorkflow()
+        running = 0
+        peak = 0
+
+        async def fake_analyze(llm_service, file_path, content, tokens):
+            nonlocal running, peak
+            # The tokens used to balance the queues are passed on, not re-encoded
+            assert tokens == list(content)
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01 * len(content))
+            running -= 1
+            return [{"line": 1, "file": file_path}]
+
+        llm_service = Mock()
+        llm_service.encode.side_effect = list
+        llm_service.count_tokens.side_effect = lambda text, tokens: len(tokens)
+        state = {
+            "files_data": [
+                {"filename": "big.py", "content": "x" * 5},
+                {"filename": "empty.py", "content": ""},
+                {"filename": "small.py", "content": "x"},
+                {"filename": "mid.py", "content": "x" * 3},
+            ],
+            "critical_files": ["big.py", "empty.py", "small.py", "mid.py"],
+            "current_file_path": None,
+            "analysis_results": [],
+            "llm_service": llm_service,
+        }
+
+        with patch("app.agents.ai_workflow.analyze_code_with_ai", fake_analyze):
+            state = await workflow.file_analysis_loop_node(state)
+
+        assert [r["file_path"] for r in state["analysis_results"]] == [
+            "big.py",
+            "small.py",
+            "mid.py",
+        ]
+        assert state["critical_files"] == []
+        assert peak > 1
+
+    @pytest.mark.asyncio
+    async def test_file_results_are_reported_as_they_finish(self):
+        """Test each analyzed file is passed to the callback in completion order."""
+        workflow = AIWorkflow()
+        reported = []
+
+        async def fake_analyze(llm_service, file_path, content, tokens):
+            await asyncio.sleep(0.01 * len(content))
+            return [{"line": 1}]
+
+        async def on_file_analyzed(file_path, file_analysis):
+            reported.append((file_path, file_analysis))
+
+        llm_service = Mock()
+        llm_service.encode.side_effect = list
+        llm_service.count_tokens.side_effect = lambda text, tokens: len(tokens)
+        state = {
+            "files_data": [
+                {"filename": "slow.py", "content": "x" * 5, "language": "python"},
+                {"filename": "fast.py", "content": "x"},
+            ],
+            "critical_files": ["slow.py", "fast.py"],
+            "current_file_path": None,
+            "analysis_results": [],
+            "llm_service": llm_service,
+            "on_file_analyzed": on_file_analyzed,
+        }
+
+        with patch("app.agents.ai_workflow.analyze_code_with_ai", fake_analyze):
+            await workflow.file_analysis_loop_node(state)
+
+        assert reported == [
+            ("fast.py", {"language": "unknown", "size": 1, "issues": [{"line": 1}]}),
+            ("slow.py", {"language": "python", "size": 5, "issues": [{"line": 1}]}),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_failed_queue_cancels_the_others(self):
+        """Test a failing callback stops the remaining queues before re-raising."""
+        workflow = AIWorkflow()
+        reported = []
+
+        async def fake_analyze(llm_service, file_path, content, tokens):
+            await asyncio.sleep(0.01 * len(content))
+            return []
+
+        async def on_file_analyzed(file_path, file_analysis):
+            if file_path == "fast.py":
+                raise RuntimeError("database unavailable")
+            reported.append(file_path)
+
+        llm_service = Mock()
+        llm_service.encode.side_effect = list
+        llm_service.count_tokens.side_effect = lambda text, tokens: len(tokens)
+        state = {
+            "files_data": [
+                {"filename": "slow.py", "content": "x" * 5},
+                {"filename": "fast.py", "content": "x"},
+            ],
+            "critical_files": ["slow.py", "fast.py"],
+            "current_file_path": None,
+            "analysis_results": [],
+            "llm_service": llm_service,
+            "on_file_analyzed": on_file_analyzed,
+        }
+
+        with patch("app.agents.ai_workflow.analyze_code_with_ai", fake_analyze):
+            with pytest.raises(RuntimeError, match="database unavailable"):
+                await workflow.file_analysis_loop_node(state)
+            # Give an orphaned queue the time it would need to finish
+            await asyncio.sleep(0.1)
+
+        assert reported == []
+
+    @pytest.mark.asyncio
+    async def test_synthesize_report_counts_issues(self):
+        """Test the summary breaks issues down by severity and type."""
+        workflow = AIWorkflow()
+        state = {
+            "analysis_results": [
+                {
+                    "file_path": "a.py",
+                    "issues": [
+                        {"severity": "high", "type": "bug"},
+                        {"severity": "unknown", "type": "bug"},
+                        {"type": "security"},
+                    ],
+                },
+                {"file_path": "b.py", "issues": []},
+            ]
+        }
+
+        state = await workflow.synthesize_report_node(state)
+
+        summary = state["final_summary"]
+        assert summary["total_files_analyzed"] == 2
+        assert summary["total_issues"] == 3
+        assert summary["severity_breakdown"] == {
+            "critical": 0,
+            "high": 1,
+            "medium": 0,
+            "low": 1,
+        }
+        assert summary["issue_type_breakdown"] == {"bug": 2, "security": 1}
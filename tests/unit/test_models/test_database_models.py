@@ -3,6 +3,8 @@
 from datetime import datetime, timezone
 from uuid import uuid4
 
+import pytest
+
 from app.models.database import (
     AnalysisTask,
     AnalysisResult,
@@ -31,7 +33,8 @@ class TestAnalysisTask:
         assert task.progress == 0.0
         assert task.retry_count == 0
         assert task.id is not None
-        assert isinstance(task.created_at, datetime)
+        # Stamped by the database clock on insert
+        assert task.created_at is None
 
     def test_task_status_enum(self):
         """Test TaskStatus enum values."""
@@ -136,7 +139,7 @@ class TestAnalysisResult:
         assert result.language == "python"
         assert result.issues == issues
         assert result.analysis_duration == 2.5
-        assert isinstance(result.created_at, datetime)
+        assert result.created_at is None
 
     def test_empty_issues_list(self):
         """Test analysis result with empty issues list."""
@@ -227,7 +230,7 @@ class TestAnalysisSummary:
         assert summary.low_issues == 4
         assert summary.code_quality_score == 75.5
         assert summary.maintainability_score == 80.0
-        assert isinstance(summary.created_at, datetime)
+        assert summary.created_at is None
 
     def test_summary_defaults(self):
         """Test summary default values."""
@@ -282,6 +285,18 @@ class TestAnalysisSummary:
         assert 0.0 <= summary.maintainability_score <= 100.0
 
 
+class TestTimestamps:
+    """Test timestamp columns."""
+
+    @pytest.mark.parametrize("model", [AnalysisTask, AnalysisResult, AnalysisSummary])
+    def test_created_at_uses_database_clock(self, model):
+        """Test created_at is filled by the database, like the lifecycle times."""
+        column = model.__table__.c.created_at
+
+        assert not column.nullable
+        assert str(column.server_default.arg) == "now()"
+
+
 class TestEnums:
     """Test enum classes."""
 
@@ -1,16 +1,75 @@
 """Tests for GitHub service."""
 
 import pytest
+import asyncio
+import base64
+import threading
+import time
 from unittest.mock import Mock, patch
 from datetime import datetime
 
-from app.services.github import GitHubService
+import redis
+from github import GithubException
+
+from app.services.github import (
+    PR_FILES_PAGE_SIZE,
+    REST_FETCH_CONCURRENCY,
+    ETagCache,
+    AsyncGitHubService,
+    GitHubService,
+)
 from app.utils.exceptions import (
     GitHubAPIException,
     InvalidRepositoryException,
+    RateLimitExceededException,
 )
 
 
+def content_payload(path, data):
+    """Build a REST contents API response for a file."""
+    return {
+        "type": "file",
+        "encoding": "base64",
+        "name": path.rsplit("/", 1)[-1],
+        "path": path,
+        "size": len(data),
+        "sha": "abc123",
+        "content": base64.b64encode(data).decode(),
+        "url": f"https://api.github.com/repos/testorg/testrepo/contents/{path}",
+        "html_url": f"https://github.com/testorg/testrepo/blob/main/{path}",
+        "download_url": f"https://raw.githubusercontent.com/testorg/testrepo/main/{path}",
+    }
+
+
+class FakeRedis:
+    """Dict-backed stand-in for the synchronous Redis client."""
+
+    def __init__(self):
+        self.store = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def set(self, key, value, ex=None):
+        self.store[key] = value
+
+    def mget(self, keys):
+        return [self.store.get(key) for key in keys]
+
+    def pipeline(self, transaction=True):
+        # Commands apply immediately, so the client doubles as its pipeline
+        return self
+
+    def execute(self):
+        return []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
 class TestGitHubService:
     """Test GitHubService class."""
 
@@ -39,7 +98,10 @@ class TestGitHubService:
             ("https://github.com/owner/repo/", ("owner", "repo")),
             ("https://github.com/user-name/repo_name", ("user-name", "repo_name")),
             ("git@github.com:owner/repo.git", ("owner", "repo")),
+            ("git@github.com:owner/repo", ("owner", "repo")),
+            ("https://github.com/owner/repo.git", ("owner", "repo")),
             ("owner/repo", ("owner", "repo")),
+            ("owner/repo.git", ("owner", "repo")),
         ],
     )
     def test_parse_repo_url_valid(self, url, expected):
@@ -68,8 +130,7 @@ class TestGitHubService:
         """Test successful PR metadata retrieval."""
         service = GitHubService("test_token")
 
-        # Mock repository and PR
-        mock_repo = Mock()
+        # Mock PR
         mock_pr = Mock()
         mock_pr.id = 123456789
         mock_pr.number = 42
@@ -102,9 +163,7 @@ class TestGitHubService:
         mock_pr.draft = False
         mock_pr.labels = []
 
-        mock_repo.get_pull.return_value = mock_pr
-
-        with patch.object(service, "get_repository", return_value=mock_repo):
+        with patch.object(service, "_get_object", return_value=mock_pr):
             metadata = service.get_pull_request_metadata(
                 "https://github.com/testorg/testrepo", 42
             )
@@ -154,9 +213,15 @@ class TestGitHubService:
 
         mock_pr = Mock()
         mock_pr.changed_files = 2
-        mock_pr.get_files.return_value = [mock_file1, mock_file2]
 
-        with patch.object(service, "get_pull_request", return_value=mock_pr):
+        with (
+            patch.object(service, "get_pull_request", return_value=mock_pr),
+            patch.object(
+                service,
+                "_list_pull_request_files",
+                return_value=[mock_file1, mock_file2],
+            ),
+        ):
             files_data = service.get_pull_request_files(
                 "https://github.com/testorg/testrepo", 42
             )
@@ -167,81 +232,419 @@ class TestGitHubService:
             assert files_data["metadata"]["total_files_in_pr"] == 2
             assert files_data["metadata"]["processed_files"] == 2
 
-    def test_get_file_content_success(self):
-        """Test successful file content retrieval."""
+    def test_get_pull_request_bundle_graphql(self):
+        """Test metadata and files are fetched in one paged GraphQL query."""
         service = GitHubService("test_token")
 
-        # Mock file content
-        mock_content = Mock()
-        mock_content.name = "main.py"
-        mock_content.size = 1024
-        mock_content.sha = "abc123"
-        mock_content.type = "file"
-        mock_content.encoding = "base64"
-        mock_content.decoded_content = b"print('Hello, World!')"
-        mock_content.download_url = (
-            "https://raw.githubusercontent.com/testorg/testrepo/main/app/main.py"
-        )
-        mock_content.html_url = (
-            "https://github.com/testorg/testrepo/blob/main/app/main.py"
-        )
+        def pr_page(nodes, has_next, cursor=None):
+            return {
+                "data": {
+                    "repository": {
+                        "pullRequest": {
+                            "databaseId": 123456789,
+                            "number": 42,
+                            "title": "Test PR",
+                            "body": "Test description",
+                            "state": "MERGED",
+                            "isDraft": False,
+                            "mergeable": "UNKNOWN",
+                            "createdAt": "2025-09-17T10:00:00Z",
+                            "updatedAt": "2025-09-17T11:00:00Z",
+                            "mergedAt": "2025-09-17T12:00:00Z",
+                            "closedAt": "2025-09-17T12:00:00Z",
+                            "additions": 30,
+                            "deletions": 5,
+                            "changedFiles": 2,
+                            "author": {
+                                "login": "testuser",
+                                "__typename": "User",
+                                "databaseId": 12345,
+                            },
+                            "baseRefName": "main",
+                            "baseRefOid": "abc123",
+                            "baseRepository": {"nameWithOwner": "testorg/testrepo"},
+                            "headRefName": "feature",
+                            "headRefOid": "def456",
+                            "headRepository": {"nameWithOwner": "fork/testrepo"},
+                            "commits": {"totalCount": 3},
+                            "labels": {"nodes": [{"name": "bug"}]},
+                            "files": {
+                                "nodes": nodes,
+                                "pageInfo": {
+                                    "hasNextPage": has_next,
+                                    "endCursor": cursor,
+                                },
+                            },
+                        }
+                    }
+                }
+            }
+
+        pages = [
+            (
+                {},
+                pr_page(
+                    [
+                        {
+                            "path": "a.py",
+                            "additions": 20,
+                            "deletions": 5,
+                            "changeType": "MODIFIED",
+                        }
+                    ],
+                    True,
+                    "c1",
+                ),
+            ),
+            (
+                {},
+                pr_page(
+                    [
+                        {
+                            "path": "b.py",
+                            "additions": 10,
+                            "deletions": 0,
+                            "changeType": "ADDED",
+                        }
+                    ],
+                    False,
+                ),
+            ),
+        ]
 
-        mock_repo = Mock()
-        mock_repo.get_contents.return_value = mock_content
+        with patch.object(
+            service._github.requester, "graphql_query", side_effect=pages
+        ) as mock_query:
+            bundle = service.get_pull_request_bundle(
+                "https://github.com/testorg/testrepo", 42
+            )
 
-        with patch.object(service, "get_repository", return_value=mock_repo):
+        assert mock_query.call_count == 2
+        assert mock_query.call_args[0][1]["after"] == "c1"
+
+        metadata = bundle["metadata"]
+        assert metadata["state"] == "closed"
+        assert metadata["head"] == {
+            "ref": "feature",
+            "sha": "def456",
+            "repo": "fork/testrepo",
+        }
+        assert metadata["author"]["login"] == "testuser"
+        assert metadata["mergeable"] is None
+        assert metadata["labels"] == ["bug"]
+
+        files = bundle["files"]["files"]
+        assert [f["filename"] for f in files] == ["a.py", "b.py"]
+        assert files[0]["changes"] == 25
+        assert files[1]["status"] == "added"
+        # GraphQL exposes no diff, blob SHA or previous path
+        assert files[0]["patch"] is None
+        assert files[0]["sha"] is None
+        assert files[0]["previous_filename"] is None
+        assert bundle["files"]["metadata"]["truncated"] is False
+
+    def test_get_pull_request_bundle_wraps_unexpected_errors(self):
+        """Test malformed GraphQL responses surface as GitHubAPIException."""
+        service = GitHubService("test_token")
+
+        with patch.object(
+            service._github.requester,
+            "graphql_query",
+            return_value=({}, {"errors": [{"message": "Something went wrong"}]}),
+        ):
+            with pytest.raises(GitHubAPIException) as exc_info:
+                service.get_pull_request_bundle(
+                    "https://github.com/testorg/testrepo", 42
+                )
+
+        assert "Failed to get PR bundle for #42" in str(exc_info.value)
+
+    def test_get_pull_request_bundle_unauthenticated_uses_rest(self):
+        """Test unauthenticated services fetch metadata and files through REST."""
+        service = GitHubService("test_token")
+        service._token = None
+
+        with (
+            patch.object(
+                service, "get_pull_request_metadata", return_value={"number": 42}
+            ),
+            patch.object(service, "get_pull_request_files", return_value={"files": []}),
+        ):
+            bundle = service.get_pull_request_bundle(
+                "https://github.com/testorg/testrepo", 42
+            )
+
+        assert bundle == {"metadata": {"number": 42}, "files": {"files": []}}
+
+    def test_content_fetch_cost(self):
+        """Test the content fetch estimate follows the fetch strategy."""
+        service = GitHubService("test_token")
+        assert service.content_fetch_cost(0) == 0
+        assert service.content_fetch_cost(51) == 2
+
+        service._token = None
+        assert service.content_fetch_cost(51) == 51
+
+    def test_get_file_content_success(self):
+        """Test successful file content retrieval."""
+        service = GitHubService("test_token")
+        payload = content_payload("app/main.py", b"print('Hello, World!')")
+
+        with patch.object(
+            service, "_conditional_get", return_value=payload
+        ) as mock_get:
             content_data = service.get_file_content(
                 "https://github.com/testorg/testrepo", "app/main.py", "main"
             )
 
+            assert mock_get.call_args[0][0] == (
+                "/repos/testorg/testrepo/contents/app/main.py?ref=main"
+            )
             assert content_data["path"] == "app/main.py"
             assert content_data["name"] == "main.py"
-            assert content_data["size"] == 1024
+            assert content_data["size"] == 22
             assert content_data["is_text"] is True
             assert "Hello, World!" in content_data["content"]
 
     def test_get_file_content_binary(self):
         """Test binary file content handling."""
         service = GitHubService("test_token")
+        payload = content_payload("image.bin", b"\x89PNG\r\n\x1a\n")  # PNG header
 
-        # Mock binary file content
-        mock_content = Mock()
-        mock_content.name = "image.png"
-        mock_content.size = 2048
-        mock_content.sha = "def456"
-        mock_content.type = "file"
-        mock_content.encoding = "base64"
-        mock_content.decoded_content = b"\x89PNG\r\n\x1a\n"  # PNG header
-        mock_content.download_url = (
-            "https://raw.githubusercontent.com/testorg/testrepo/main/image.png"
-        )
-        mock_content.html_url = (
-            "https://github.com/testorg/testrepo/blob/main/image.png"
-        )
+        with patch.object(service, "_conditional_get", return_value=payload):
+            content_data = service.get_file_content(
+                "https://github.com/testorg/testrepo", "image.bin", "main"
+            )
+
+            assert content_data["is_text"] is False
+            assert content_data["content"] is None
+
+    def test_get_file_content_nul_bytes_not_decoded(self):
+        """Test content with NUL bytes is classified as binary without decoding."""
+        service = GitHubService("test_token")
+        payload = content_payload("blob.dat", b"data\x00\x01\x02")
+
+        with patch.object(service, "_conditional_get", return_value=payload):
+            content_data = service.get_file_content(
+                "https://github.com/testorg/testrepo", "blob.dat", "main"
+            )
+
+            assert content_data["is_text"] is False
+            assert content_data["content"] is None
+
+    def test_get_file_content_directory(self):
+        """Test a directory path is rejected."""
+        service = GitHubService("test_token")
+
+        with patch.object(service, "_conditional_get", return_value=[]):
+            with pytest.raises(GitHubAPIException) as exc_info:
+                service.get_file_content(
+                    "https://github.com/testorg/testrepo", "app", "main"
+                )
+
+        assert "is not a file" in str(exc_info.value)
 
-        mock_repo = Mock()
-        mock_repo.get_contents.return_value = mock_content
+    @pytest.mark.parametrize(
+        "file_path,reason",
+        [
+            ("assets/logo.PNG", "binary"),
+            ("dist/wheel.whl", "binary"),
+            ("node_modules/lodash/index.js", "vendored"),
+            ("web/vendor/jquery.js", "vendored"),
+            ("build/out.js", "vendored"),
+            ("web/package-lock.json", "lockfile"),
+            ("Cargo.lock", "lockfile"),
+        ],
+    )
+    def test_get_file_content_skips_without_fetch(self, file_path, reason):
+        """Test binary and vendored paths are skipped before any API call."""
+        service = GitHubService("test_token")
 
-        with patch.object(service, "get_repository", return_value=mock_repo):
+        with patch.object(service, "_conditional_get") as mock_get:
             content_data = service.get_file_content(
-                "https://github.com/testorg/testrepo", "image.png", "main"
+                "https://github.com/testorg/testrepo", file_path, "main"
             )
 
+            mock_get.assert_not_called()
             assert content_data["is_text"] is False
             assert content_data["content"] is None
+            assert content_data["skip_reason"] == reason
+
+    @pytest.mark.parametrize(
+        "file_path", ["app/main.py", "src/builder.py", "docs/distribution.md"]
+    )
+    def test_skip_reason_ignores_regular_files(self, file_path):
+        """Test regular source files are not skipped."""
+        assert GitHubService.skip_reason(file_path) is None
+
+    def test_get_files_content_batch_graphql(self):
+        """Test file contents are fetched in one aliased GraphQL query."""
+        service = GitHubService("test_token")
+        response = {
+            "data": {
+                "repository": {
+                    "f0": {
+                        "text": "print('hi')",
+                        "isBinary": False,
+                        "isTruncated": False,
+                        "byteSize": 11,
+                    },
+                    "f1": {
+                        "text": None,
+                        "isBinary": True,
+                        "isTruncated": False,
+                        "byteSize": 64,
+                    },
+                    "f2": None,
+                }
+            }
+        }
+
+        with patch.object(
+            service._github.requester, "graphql_query", return_value=({}, response)
+        ) as mock_query:
+            contents = service.get_files_content_batch(
+                "https://github.com/testorg/testrepo",
+                ["app/main.py", "data.bin", "deleted.py", "logo.png"],
+                "abc123",
+            )
+
+        mock_query.assert_called_once()
+        query, variables = mock_query.call_args[0]
+        assert "f2: object(expression: $e2)" in query
+        assert variables["owner"] == "testorg"
+        assert variables["e0"] == "abc123:app/main.py"
+        assert "e3" not in variables  # binary extension never queried
+
+        assert contents["app/main.py"]["content"] == "print('hi')"
+        assert contents["app/main.py"]["is_text"] is True
+        assert contents["data.bin"]["is_text"] is False
+        assert contents["logo.png"]["skip_reason"] == "binary"
+        assert "deleted.py" not in contents
+
+    def test_get_files_content_batch_splits_large_batches(self):
+        """Test lookups are split across queries of limited size."""
+        service = GitHubService("test_token")
+        paths = [f"src/file{i}.py" for i in range(60)]
+
+        def fake_query(query, variables):
+            count = len(variables) - 2
+            blob = {"text": "x", "isBinary": False, "isTruncated": False, "byteSize": 1}
+            return {}, {"data": {"repository": {f"f{i}": blob for i in range(count)}}}
+
+        with patch.object(
+            service._github.requester, "graphql_query", side_effect=fake_query
+        ) as mock_query:
+            contents = service.get_files_content_batch(
+                "https://github.com/testorg/testrepo", paths, "abc123"
+            )
+
+        assert mock_query.call_count == 2
+        assert set(contents) == set(paths)
+
+    def test_get_files_content_batch_reuses_cached_contents(self):
+        """Test contents fetched once at a commit are served from the cache."""
+        service = GitHubService("test_token")
+        service._redis_client = FakeRedis()
+        blob = {"text": "x = 1", "isBinary": False, "isTruncated": False, "byteSize": 5}
+
+        def fake_query(query, variables):
+            count = len(variables) - 2
+            return {}, {"data": {"repository": {f"f{i}": blob for i in range(count)}}}
+
+        with patch.object(
+            service._github.requester, "graphql_query", side_effect=fake_query
+        ) as mock_query:
+            first = service.get_files_content_batch(
+                "https://github.com/testorg/testrepo", ["a.py"], "abc123"
+            )
+            second = service.get_files_content_batch(
+                "https://github.com/testorg/testrepo", ["a.py", "b.py"], "abc123"
+            )
+
+        assert mock_query.call_count == 2
+        # Only the file missing from the cache is queried the second time
+        assert mock_query.call_args[0][1]["e0"] == "abc123:b.py"
+        assert "e1" not in mock_query.call_args[0][1]
+        assert second["a.py"] == first["a.py"]
+        assert second["b.py"]["content"] == "x = 1"
+
+    def test_get_files_content_batch_unauthenticated_uses_rest(self):
+        """Test unauthenticated services fetch each file through REST."""
+        service = GitHubService("test_token")
+        service._token = None
+
+        def fake_get_file_content(repo_url, file_path, commit_sha):
+            if file_path == "b.py":
+                raise GitHubAPIException("not found")
+            return {"path": file_path, "content": "x", "is_text": True}
+
+        with patch.object(
+            service, "get_file_content", side_effect=fake_get_file_content
+        ):
+            contents = service.get_files_content_batch(
+                "https://github.com/testorg/testrepo",
+                ["a.py", "b.py", "c.py"],
+                "abc123",
+            )
+
+        assert list(contents) == ["a.py", "c.py"]
+
+    def test_fetch_files_rest_overlaps_requests(self):
+        """Test REST fallback fetches run concurrently up to the cap."""
+        service = GitHubService("test_token")
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def slow_get_file_content(repo_url, file_path, commit_sha):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+            return {"path": file_path, "content": "x", "is_text": True}
+
+        paths = [f"src/file{i}.py" for i in range(25)]
+        with patch.object(
+            service, "get_file_content", side_effect=slow_get_file_content
+        ):
+            contents = service._fetch_files_rest(
+                "https://github.com/testorg/testrepo", paths, "abc123"
+            )
+
+        assert list(contents) == paths
+        assert 1 < peak <= REST_FETCH_CONCURRENCY
+
+    def test_fetch_files_rest_reuses_thread_pool(self):
+        """Test REST fallback calls share one thread pool instead of creating one each."""
+        service = GitHubService("test_token")
+        threads = set()
+
+        def get_file_content(repo_url, file_path, commit_sha):
+            threads.add(threading.current_thread().name)
+            return {"path": file_path, "content": "x", "is_text": True}
+
+        with patch.object(service, "get_file_content", side_effect=get_file_content):
+            for _ in range(3):
+                service._fetch_files_rest(
+                    "https://github.com/testorg/testrepo", ["a.py", "b.py"], "abc123"
+                )
+
+        assert all(name.startswith("github-rest") for name in threads)
+        assert len(threads) <= REST_FETCH_CONCURRENCY
 
     def test_file_too_large(self):
         """Test handling of files that are too large."""
         service = GitHubService("test_token")
 
-        # Mock large file
-        mock_content = Mock()
-        mock_content.size = 2 * 1024 * 1024  # 2MB (larger than 1MB limit)
-
-        mock_repo = Mock()
-        mock_repo.get_contents.return_value = mock_content
+        # 2MB, larger than the 1MB limit
+        payload = content_payload("large_file.py", b"")
+        payload["size"] = 2 * 1024 * 1024
 
-        with patch.object(service, "get_repository", return_value=mock_repo):
+        with patch.object(service, "_conditional_get", return_value=payload):
             with pytest.raises(GitHubAPIException) as exc_info:
                 service.get_file_content(
                     "https://github.com/testorg/testrepo", "large_file.py", "main"
@@ -250,22 +653,116 @@ class TestGitHubService:
             assert "exceeds maximum" in str(exc_info.value)
 
     def test_rate_limit_info_update(self):
-        """Test rate limit information update."""
+        """Test rate limit information is read from the last response headers."""
         service = GitHubService("test_token")
+        service._github = Mock()
+        service._github.requester.rate_limiting = (4500, 5000)
+        service._github.requester.rate_limiting_resettime = 1758117600
 
-        # Mock rate limit response
-        mock_rate_limit = Mock()
-        mock_core = Mock()
-        mock_core.remaining = 4500
-        mock_core.reset = "2025-09-17T14:00:00Z"
-        mock_rate_limit.core = mock_core
+        service._update_rate_limit_info()
 
-        with patch.object(
-            service._github, "get_rate_limit", return_value=mock_rate_limit
-        ):
-            service._update_rate_limit_info()
+        assert service.rate_limit_remaining == 4500
+        assert service.rate_limit_limit == 5000
+        assert service._rate_limit_reset == datetime.fromtimestamp(1758117600)
+        service._github.get_rate_limit.assert_not_called()
+
+    def test_rate_limit_info_before_any_request(self):
+        """Test rate limit information is left unset before any response."""
+        service = GitHubService("test_token")
+
+        service._update_rate_limit_info()
+
+        assert service.rate_limit_remaining is None
+
+    @patch("app.services.github.time.sleep")
+    def test_retry_recovers_from_secondary_rate_limit(self, mock_sleep):
+        """Test transient rate limits are retried with backoff."""
+        service = GitHubService("test_token")
+        rate_limited = GithubException(
+            403,
+            {"message": "You have exceeded a secondary limit"},
+            {"retry-after": "2"},
+        )
+        func = Mock(side_effect=[rate_limited, "ok"])
+
+        assert service._retry("test", func, "arg") == "ok"
+        assert func.call_count == 2
+        assert 2 <= mock_sleep.call_args[0][0] < 2.5
+
+    @patch("app.services.github.time.sleep")
+    def test_retry_gives_up_after_max_retries(self, mock_sleep):
+        """Test rate limits are raised once retries are exhausted."""
+        service = GitHubService("test_token")
+        func = Mock(side_effect=GithubException(429, {"message": "slow down"}, {}))
+
+        with pytest.raises(GithubException):
+            service._retry("test", func)
+
+        max_retries = service.settings.github.max_retries
+        assert func.call_count == max_retries + 1
+        # Exponential backoff without headers: 1s, 2s, 4s (+ jitter)
+        for attempt, call in enumerate(mock_sleep.call_args_list):
+            assert 2**attempt <= call[0][0] < 2**attempt + 0.5
+
+    @patch("app.services.github.time.sleep")
+    def test_retry_does_not_wait_for_distant_reset(self, mock_sleep):
+        """Test an exhausted primary limit is raised without sleeping."""
+        service = GitHubService("test_token")
+        reset = str(int(time.time()) + 3600)
+        func = Mock(
+            side_effect=GithubException(
+                403,
+                {"message": "API rate limit exceeded"},
+                {"x-ratelimit-remaining": "0", "x-ratelimit-reset": reset},
+            )
+        )
+
+        with pytest.raises(GithubException):
+            service._retry("test", func)
+
+        assert func.call_count == 1
+        mock_sleep.assert_not_called()
 
-            assert service.rate_limit_remaining == 4500
+    @patch("app.services.github.time.sleep")
+    def test_retry_ignores_other_errors(self, mock_sleep):
+        """Test non rate-limit errors are not retried."""
+        service = GitHubService("test_token")
+        func = Mock(side_effect=GithubException(404, {"message": "Not Found"}, {}))
+
+        with pytest.raises(GithubException):
+            service._retry("test", func)
+
+        assert func.call_count == 1
+        mock_sleep.assert_not_called()
+
+    def test_rate_limit_exception_uses_reset_header(self):
+        """Test the rate limit exception carries the time until reset."""
+        service = GitHubService("test_token")
+        reset = int(time.time()) + 120
+        exc = GithubException(
+            403,
+            {"message": "API rate limit exceeded"},
+            {"x-ratelimit-remaining": "0", "x-ratelimit-reset": str(reset)},
+        )
+
+        with pytest.raises(RateLimitExceededException) as exc_info:
+            service._handle_github_exception(exc, "test")
+
+        assert 100 <= exc_info.value.retry_after <= 120
+
+    def test_rate_limit_exception_uses_retry_after_header(self):
+        """Test a secondary limit's Retry-After is passed on to the caller."""
+        service = GitHubService("test_token")
+        exc = GithubException(
+            403,
+            {"message": "You have exceeded a secondary limit"},
+            {"retry-after": "30"},
+        )
+
+        with pytest.raises(RateLimitExceededException) as exc_info:
+            service._handle_github_exception(exc, "test")
+
+        assert exc_info.value.retry_after == 30
 
     def test_string_representation(self):
         """Test string representation of GitHubService."""
@@ -274,3 +771,135 @@ class TestGitHubService:
 
         assert "authenticated" in str(service_auth)
         # The no-auth case depends on environment variables
+
+
+class TestETagCache:
+    """Test conditional requests backed by the ETag cache."""
+
+    def test_cache_round_trip(self):
+        """Test stored responses are returned with their ETag."""
+        cache = ETagCache(FakeRedis(), "scope", 60)
+
+        assert cache.get("/repos/a/b") is None
+        cache.put("/repos/a/b", '"v1"', {"number": 1})
+
+        assert cache.get("/repos/a/b") == ('"v1"', {"number": 1})
+
+    def test_redis_errors_are_cache_misses(self):
+        """Test an unavailable Redis never fails a request."""
+        client = Mock()
+        client.get.side_effect = redis.ConnectionError("down")
+        client.set.side_effect = redis.ConnectionError("down")
+        cache = ETagCache(client, "scope", 60)
+
+        cache.put("/repos/a/b", '"v1"', {})
+        assert cache.get("/repos/a/b") is None
+
+    def test_conditional_get_stores_etag(self):
+        """Test a fresh response is cached under its ETag."""
+        service = GitHubService("test_token")
+        service._etag_cache = ETagCache(FakeRedis(), "scope", 60)
+
+        with patch.object(
+            service._github.requester,
+            "requestJsonAndCheck",
+            return_value=({"etag": '"v1"'}, {"number": 42}),
+        ) as mock_request:
+            data = service._conditional_get("/repos/a/b/pulls/42", "fetching PR")
+
+        assert data == {"number": 42}
+        assert mock_request.call_args.kwargs["headers"] is None
+        assert service._etag_cache.get("/repos/a/b/pulls/42") == ('"v1"', data)
+
+    def test_conditional_get_not_modified(self):
+        """Test a 304 response is served from the cache."""
+        service = GitHubService("test_token")
+        service._etag_cache = ETagCache(FakeRedis(), "scope", 60)
+        service._etag_cache.put("/repos/a/b/pulls/42", '"v1"', {"number": 42})
+
+        with patch.object(
+            service._github.requester,
+            "requestJsonAndCheck",
+            return_value=({"etag": '"v1"'}, None),
+        ) as mock_request:
+            data = service._conditional_get("/repos/a/b/pulls/42", "fetching PR")
+
+        assert data == {"number": 42}
+        assert mock_request.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+
+    def test_list_pull_request_files_pages(self):
+        """Test PR files are listed page by page up to the limit."""
+        service = GitHubService("test_token")
+        pull_request = Mock(url="https://api.github.com/repos/a/b/pulls/42")
+        pages = [
+            [{"filename": f"f{i}.py"} for i in range(PR_FILES_PAGE_SIZE)],
+            [{"filename": "last.py"}],
+        ]
+
+        with patch.object(service, "_conditional_get", side_effect=pages) as mock_get:
+            files = service._list_pull_request_files(pull_request, 500)
+
+        assert mock_get.call_count == 2
+        assert mock_get.call_args[0][0].endswith(
+            f"/pulls/42/files?per_page={PR_FILES_PAGE_SIZE}&page=2"
+        )
+        assert len(files) == PR_FILES_PAGE_SIZE + 1
+        assert files[-1].filename == "last.py"
+
+
+class TestAsyncGitHubService:
+    """Test AsyncGitHubService facade."""
+
+    @pytest.mark.asyncio
+    async def test_calls_run_off_the_event_loop(self):
+        """Test sync calls are delegated to worker threads."""
+        service = GitHubService("test_token")
+        loop_thread = threading.get_ident()
+        calls = []
+
+        def fake_get_file_content(repo_url, file_path, commit_sha):
+            calls.append(threading.get_ident())
+            return {"path": file_path}
+
+        with patch.object(service, "get_file_content", fake_get_file_content):
+            async_service = AsyncGitHubService(service)
+            results = await asyncio.gather(
+                *(
+                    async_service.get_file_content("owner/repo", f"f{i}.py", "sha")
+                    for i in range(3)
+                )
+            )
+
+        assert [r["path"] for r in results] == ["f0.py", "f1.py", "f2.py"]
+        assert loop_thread not in calls
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_capped(self):
+        """Test no more than max_concurrency calls run at once."""
+        service = GitHubService("test_token")
+        lock = threading.Lock()
+        active = 0
+        peak = 0
+
+        def fake_get_pull_request_files(repo_url, pr_number):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+            return {"files": []}
+
+        with patch.object(
+            service, "get_pull_request_files", fake_get_pull_request_files
+        ):
+            async_service = AsyncGitHubService(service, max_concurrency=2)
+            await asyncio.gather(
+                *(
+                    async_service.get_pull_request_files("owner/repo", n)
+                    for n in range(6)
+                )
+            )
+
+        assert peak <= 2
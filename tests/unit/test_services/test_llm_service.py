@@ -0,0 +1,247 @@
+"""Tests for LLM service."""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+
+from app.models.database import IssueSeverity, IssueType
+from app.config.settings import get_settings
+from app.services.llm_service import AIAnalysisResult, LLMService
+
+
+class CharEncoding:
+    """Tokenizer stand-in that treats every character as one token."""
+
+    def encode(self, text):
+        return list(text)
+
+    def decode(self, tokens):
+        return "".join(tokens)
+
+
+@pytest.fixture
+def llm_service():
+    """LLMService with a character-level tokenizer and a small prompt budget."""
+    with patch("app.services.llm_service._load_encoding", return_value=CharEncoding()):
+        service = LLMService()
+    service.settings = service.settings.model_copy(deep=True)
+    service.settings.llm.max_prompt_tokens = 20
+    service.settings.llm.chunk_overlap_tokens = 5
+    return service
+
+
+class TestLLMService:
+    """Test LLMService class."""
+
+    def test_small_content_is_single_chunk(self, llm_service):
+        """Test content within the budget is not split."""
+        assert llm_service._split_into_chunks("x = 1\n") == [(0, "x = 1\n")]
+
+    def test_split_into_chunks_tracks_line_offsets(self, llm_service):
+        """Test large content is split into overlapping chunks with line offsets."""
+        content = "".join(f"line{i:02d}\n" for i in range(10))  # 7 chars per line
+
+        chunks = llm_service._split_into_chunks(content)
+
+        # Chunks start 15 tokens apart (budget minus overlap)
+        assert [chunk for _, chunk in chunks] == [
+            content[start : start + 20] for start in (0, 15, 30, 45, 60)
+        ]
+        assert [offset for offset, _ in chunks] == [0, 2, 4, 6, 8]
+
+    def test_split_reuses_given_tokens(self, llm_service):
+        """Test content encoded by the caller is not encoded again."""
+        content = "".join(f"line{i:02d}\n" for i in range(10))
+        llm_service._enc = Mock(wraps=CharEncoding())
+
+        chunks = llm_service._split_into_chunks(content, list(content))
+
+        llm_service._enc.encode.assert_not_called()
+        assert [offset for offset, _ in chunks] == [0, 2, 4, 6, 8]
+
+    def test_split_without_tokenizer(self, llm_service):
+        """Test content is sent whole when no tokenizer is available."""
+        llm_service._enc = None
+        content = "a" * 100
+        assert llm_service._split_into_chunks(content) == [(0, content)]
+
+    @pytest.mark.parametrize(
+        "content,reason",
+        [
+            ("def f():\n    return 1\n", None),
+            ("# @generated by protoc\nx = 1\n", "generated file"),
+            (
+                "#!/usr/bin/env python\n\n# Copyright\n# @generated\nx = 1\n",
+                "generated file",
+            ),
+            (
+                "// Code generated by protoc-gen-go. DO NOT EDIT.\npackage pb\n",
+                "generated file",
+            ),
+            ("/* @generated */\nvar a = 1;\n", "generated file"),
+            ("var a=1;" * 200, "minified file"),
+            # Markers outside the leading comments are ordinary text
+            ("x = 1  # do not edit\n", None),
+            ("# Config loader\nAUTOGENERATED = True\n", None),
+            ("x = 1\n# @generated markers are skipped\n", None),
+            ("// Code generated here. Do not edit by hand.\nvar a;\n", None),
+        ],
+    )
+    def test_skip_reason(self, content, reason):
+        """Test detection of generated and minified files."""
+        skip_reason = LLMService._skip_reason(content)
+        if reason is None:
+            assert skip_reason is None
+        else:
+            assert skip_reason.startswith(reason)
+
+    @pytest.mark.asyncio
+    async def test_analyze_code_merges_chunk_issues(self, llm_service):
+        """Test chunk issues are shifted to file lines and deduplicated."""
+        content = "".join(f"line{i:02d}\n" for i in range(5))
+        chunk_issues = [
+            [{"type": "bug", "line": 3, "description": "a"}],
+            [
+                {"type": "bug", "line": 1, "description": "a (overlap)"},
+                {"type": "style", "line": 2, "description": "b"},
+            ],
+        ]
+        llm_service._analyze_chunk = AsyncMock(side_effect=chunk_issues)
+
+        issues = await llm_service.analyze_code("app.py", content, "comprehensive")
+
+        assert llm_service._analyze_chunk.await_count == 2
+        assert [(i["type"], i["line"]) for i in issues] == [("bug", 3), ("style", 4)]
+
+    @pytest.mark.asyncio
+    async def test_analyze_code_keeps_distinct_issues_on_one_line(self, llm_service):
+        """Test issues sharing a type and line are only merged in chunk overlaps."""
+        content = "".join(f"line{i:02d}\n" for i in range(5))
+        chunk_issues = [
+            [
+                {"type": "bug", "line": 1, "description": "a"},
+                {"type": "bug", "line": 1, "description": "b"},
+                {"type": "bug", "line": 3, "description": "c"},
+            ],
+            [
+                {"type": "bug", "line": 1, "description": "c (overlap)"},
+                {"type": "bug", "line": 3, "description": "d"},
+                {"type": "bug", "line": 3, "description": "e"},
+            ],
+        ]
+        llm_service._analyze_chunk = AsyncMock(side_effect=chunk_issues)
+
+        issues = await llm_service.analyze_code("app.py", content, "comprehensive")
+
+        assert [i["description"] for i in issues] == ["a", "b", "c", "d", "e"]
+
+    @pytest.mark.asyncio
+    async def test_single_chunk_issues_are_not_deduplicated(self, llm_service):
+        """Test a file analyzed in one prompt keeps every reported issue."""
+        issues = [
+            {"type": "bug", "line": 1, "description": "a"},
+            {"type": "bug", "line": 1, "description": "b"},
+        ]
+        llm_service._analyze_chunk = AsyncMock(return_value=issues)
+
+        assert await llm_service.analyze_code("app.py", "x = 1\n", "bug") == issues
+
+    @pytest.mark.asyncio
+    async def test_analyze_code_skips_generated_files(self, llm_service):
+        """Test generated files never reach the LLM."""
+        llm_service._analyze_chunk = AsyncMock()
+
+        with patch("app.services.llm_service.logger") as mock_logger:
+            issues = await llm_service.analyze_code(
+                "gen.py", "# @generated\nx = 1\n", "comprehensive"
+            )
+
+        assert issues == []
+        llm_service._analyze_chunk.assert_not_awaited()
+        mock_logger.info.assert_called_once_with(
+            "Skipping gen.py: generated file ('@generated')"
+        )
+
+    @pytest.mark.asyncio
+    async def test_analyze_chunk_uses_structured_output(self, llm_service):
+        """Test the parsed structured response is returned as issue dicts."""
+        parsed = AIAnalysisResult.model_validate(
+            {
+                "issues": [
+                    {
+                        "type": "BUG",
+                        "severity": "high",
+                        "line": 3,
+                        "description": "Off by one",
+                        "suggestion": "Use <=",
+                    }
+                ]
+            }
+        )
+        completion = Mock()
+        completion.choices = [Mock(message=Mock(parsed=parsed, refusal=None))]
+        llm_service.client = Mock()
+        llm_service.client.chat.completions.parse = AsyncMock(return_value=completion)
+
+        issues = await llm_service._analyze_chunk("app.py", "x = 1", "bug")
+
+        call_kwargs = llm_service.client.chat.completions.parse.call_args.kwargs
+        assert call_kwargs["response_format"] is AIAnalysisResult
+        assert issues == [
+            {
+                "type": IssueType.BUG,
+                "severity": IssueSeverity.HIGH,
+                "line": 3,
+                "description": "Off by one",
+                "suggestion": "Use <=",
+            }
+        ]
+
+    @pytest.mark.asyncio
+    async def test_analyze_chunk_handles_refusal(self, llm_service):
+        """Test a refusal without a parsed result yields no issues."""
+        completion = Mock()
+        completion.choices = [Mock(message=Mock(parsed=None, refusal="no"))]
+        llm_service.client = Mock()
+        llm_service.client.chat.completions.parse = AsyncMock(return_value=completion)
+
+        assert await llm_service._analyze_chunk("app.py", "x = 1", "bug") == []
+
+    @pytest.mark.asyncio
+    async def test_chunk_requests_share_a_concurrency_limit(self):
+        """Test chunked files never exceed max_concurrent_analyses LLM calls."""
+        settings = get_settings().model_copy(deep=True)
+        settings.llm.max_prompt_tokens = 20
+        settings.llm.chunk_overlap_tokens = 5
+        settings.agent.max_concurrent_analyses = 2
+        with (
+            patch("app.services.llm_service.get_settings", return_value=settings),
+            patch(
+                "app.services.llm_service._load_encoding",
+                return_value=CharEncoding(),
+            ),
+        ):
+            service = LLMService()
+
+        running = 0
+        peak = 0
+
+        async def parse(**kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return Mock(choices=[Mock(message=Mock(parsed=None, refusal="no"))])
+
+        service.client = Mock()
+        service.client.chat.completions.parse = parse
+        content = "".join(f"line{i:02d}\n" for i in range(10))  # 5 chunks
+
+        await asyncio.gather(
+            service.analyze_code("a.py", content, "bug"),
+            service.analyze_code("b.py", content, "bug"),
+        )
+
+        assert peak == 2
@@ -0,0 +1,587 @@
+"""Tests for PR analysis Celery tasks."""
+
+import asyncio
+import threading
+from datetime import datetime, timedelta
+from functools import partial
+
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+from uuid import uuid4
+
+from celery.exceptions import Retry
+
+from app.models.database import AnalysisSummary, TaskStatus
+from app.services.github import GitHubService
+from app.utils.exceptions import RateLimitExceededException
+from app.tasks import analyze_tasks
+from app.tasks.analyze_tasks import (
+    FileResultWriter,
+    _analyze_pr,
+    _ensure_rate_budget,
+    _summary_fields,
+    run_async_in_celery,
+    save_analysis_results,
+    update_task_status,
+)
+
+
+PR_METADATA = {
+    "title": "Test PR",
+    "state": "open",
+    "head": {"repo": "testorg/testrepo", "sha": "def456"},
+}
+
+PR_FILES = {
+    "files": [
+        {"filename": "app/main.py", "additions": 10, "deletions": 2, "changes": 12},
+        {"filename": "huge.py", "additions": 900, "deletions": 200, "changes": 1100},
+        {"filename": "logo.png", "additions": 0, "deletions": 0, "changes": 0},
+        {"filename": "yarn.lock", "additions": 40, "deletions": 3, "changes": 43},
+        {"filename": "old.py", "status": "removed", "deletions": 5, "changes": 5},
+        {"filename": "data.txt", "additions": 1, "deletions": 0, "changes": 1},
+    ]
+}
+
+FILE_CONTENTS = {
+    "app/main.py": {"path": "app/main.py", "content": "x = 1\n", "is_text": True},
+    "data.txt": {"path": "data.txt", "content": None, "is_text": False},
+}
+
+ANALYSIS_RESULTS = {
+    "summary": {"total_issues": 1},
+    "files": {"app/main.py": {"language": "python", "size": 6, "issues": []}},
+}
+
+
+@pytest.fixture
+def mock_github():
+    """Synchronous GitHubService stand-in."""
+    github = Mock()
+    github.get_pull_request_bundle.return_value = {
+        "metadata": PR_METADATA,
+        "files": PR_FILES,
+    }
+    github.get_files_content_batch.return_value = FILE_CONTENTS
+    github.rate_limit_remaining = 5000
+    github.rate_limit_limit = 5000
+    github.rate_limit_reset = None
+    github.content_fetch_cost.return_value = 1
+    analyze_tasks._github_service_for.cache_clear()
+    with patch("app.tasks.analyze_tasks.GitHubService") as service_cls:
+        service_cls.return_value = github
+        service_cls.skip_reason = GitHubService.skip_reason
+        yield github
+    analyze_tasks._github_service_for.cache_clear()
+
+
+@pytest.fixture
+def mock_analyzer():
+    """LangGraphAnalyzer stand-in that reports each file as it finishes."""
+
+    async def analyze_pr(pr_data, files_data, on_file_analyzed=None):
+        for file_path, file_analysis in ANALYSIS_RESULTS["files"].items():
+            await on_file_analyzed(file_path, file_analysis)
+        return ANALYSIS_RESULTS
+
+    analyzer = Mock()
+    analyzer.analyze_pr = AsyncMock(side_effect=analyze_pr)
+    with patch("app.tasks.analyze_tasks.LangGraphAnalyzer", return_value=analyzer):
+        yield analyzer
+
+
+@pytest.fixture
+def mock_db():
+    """Database helpers used by the task."""
+    with (
+        patch(
+            "app.tasks.analyze_tasks.update_task_status", new_callable=AsyncMock
+        ) as update_status,
+        patch(
+            "app.tasks.analyze_tasks.save_analysis_results", new_callable=AsyncMock
+        ) as save_results,
+    ):
+        yield Mock(update_status=update_status, save_results=save_results)
+
+
+class TestAnalyzePR:
+    """Test the PR analysis coroutine."""
+
+    @pytest.mark.asyncio
+    async def test_happy_path(self, mock_github, mock_analyzer, mock_db):
+        """Test a PR is fetched, analyzed and saved."""
+        task_id = str(uuid4())
+
+        result = await _analyze_pr(
+            Mock(), task_id, "https://github.com/testorg/testrepo", 42, None
+        )
+
+        assert result["status"] == "completed"
+        assert result["files_analyzed"] == 1
+
+        # Oversized, binary, lock and removed files are never fetched
+        _, paths, sha = mock_github.get_files_content_batch.call_args[0]
+        assert paths == ["app/main.py", "data.txt"]
+        assert sha == "def456"
+
+        # Only text files reach the analyzer
+        files_for_analysis = mock_analyzer.analyze_pr.call_args[0][1]
+        assert [f["filename"] for f in files_for_analysis] == ["app/main.py"]
+        assert files_for_analysis[0]["language"] == "python"
+
+        # Status rows are only written on state transitions; completion is
+        # written by save_analysis_results
+        mock_db.save_results.assert_awaited_once()
+        saved = mock_db.save_results.await_args[0][1]
+        assert list(saved["files"]) == ["app/main.py"]
+        assert mock_db.save_results.await_args.kwargs["clear_existing"] is True
+        assert [
+            (call.args[1], call.args[2])
+            for call in mock_db.update_status.await_args_list
+        ] == [(TaskStatus.PROCESSING, 0.0)]
+
+    @pytest.mark.asyncio
+    async def test_github_service_is_reused_per_token(
+        self, mock_github, mock_analyzer, mock_db
+    ):
+        """Test tasks with the same token share one GitHub service."""
+        for token in ("token-a", "token-a", "token-b"):
+            await _analyze_pr(
+                Mock(), str(uuid4()), "https://github.com/testorg/testrepo", 42, token
+            )
+
+        assert [call.args for call in analyze_tasks.GitHubService.call_args_list] == [
+            ("token-a",),
+            ("token-b",),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_analysis_failure_marks_task_failed(
+        self, mock_github, mock_analyzer, mock_db
+    ):
+        """Test a failed analysis result fails the task without saving."""
+        mock_analyzer.analyze_pr.side_effect = None
+        mock_analyzer.analyze_pr.return_value = {"status": "failed", "error": "boom"}
+
+        result = await _analyze_pr(
+            Mock(), str(uuid4()), "https://github.com/testorg/testrepo", 42, None
+        )
+
+        assert result["error"] == "Analysis failed: boom"
+        mock_db.save_results.assert_not_awaited()
+        final_status = mock_db.update_status.await_args_list[-1][0]
+        assert final_status[1] == TaskStatus.FAILED
+
+    @pytest.mark.asyncio
+    async def test_failure_after_flush_discards_partial_results(
+        self, mock_github, mock_analyzer
+    ):
+        """Test results flushed before a mid-analysis failure are deleted."""
+
+        async def analyze_pr(pr_data, files_data, on_file_analyzed=None):
+            await on_file_analyzed("app/main.py", {"language": "python"})
+            raise RuntimeError("model unavailable")
+
+        mock_analyzer.analyze_pr.side_effect = analyze_pr
+        session = Mock(
+            execute=AsyncMock(return_value=Mock(rowcount=1)), commit=AsyncMock()
+        )
+
+        with (
+            patch.object(
+                analyze_tasks,
+                "FileResultWriter",
+                partial(FileResultWriter, batch_size=1),
+            ),
+            patch(
+                "app.tasks.analyze_tasks.get_database_manager",
+                return_value=mock_db_manager(session),
+            ),
+        ):
+            result = await _analyze_pr(
+                Mock(), str(uuid4()), "https://github.com/testorg/testrepo", 42, None
+            )
+
+        assert result["error"] == "Analysis engine failed: model unavailable"
+        statements = [call.args[0] for call in session.execute.await_args_list]
+        sql = [str(stmt).split(" (")[0] for stmt in statements]
+        # The flushed batch replaced earlier rows, and the failure deletes it
+        # in the same transaction that marks the task failed
+        assert sql[-4:] == [
+            "DELETE FROM analysis_results WHERE analysis_results.task_id = :task_id_1",
+            "INSERT INTO analysis_results",
+            "DELETE FROM analysis_results WHERE analysis_results.task_id = :task_id_1",
+            sql[-1],
+        ]
+        assert statements[-1].compile().params["status"] == TaskStatus.FAILED
+
+    @pytest.mark.asyncio
+    async def test_unreachable_rate_budget_fails_task(
+        self, mock_github, mock_analyzer, mock_db
+    ):
+        """Test a PR too large for an unauthenticated window fails without retry."""
+        mock_github.rate_limit_remaining = 60
+        mock_github.rate_limit_limit = 60
+        mock_github.content_fetch_cost.return_value = 100
+        celery_task = Mock()
+
+        result = await _analyze_pr(
+            celery_task, str(uuid4()), "https://github.com/testorg/testrepo", 42, None
+        )
+
+        assert "provide a GitHub token" in result["error"]
+        celery_task.retry.assert_not_called()
+        mock_github.get_files_content_batch.assert_not_called()
+        final_status = mock_db.update_status.await_args_list[-1][0]
+        assert final_status[1] == TaskStatus.FAILED
+
+    @pytest.mark.asyncio
+    async def test_low_rate_limit_schedules_retry(
+        self, mock_github, mock_analyzer, mock_db
+    ):
+        """Test the task retries after the reset instead of exhausting the budget."""
+        mock_github.rate_limit_remaining = 0
+        mock_github.rate_limit_reset = datetime.now() + timedelta(minutes=10)
+        celery_task = Mock()
+        celery_task.retry.side_effect = Retry()
+
+        with pytest.raises(Retry):
+            await _analyze_pr(
+                celery_task,
+                str(uuid4()),
+                "https://github.com/testorg/testrepo",
+                42,
+                None,
+            )
+
+        countdown = celery_task.retry.call_args.kwargs["countdown"]
+        assert 540 < countdown <= 600
+        mock_github.get_files_content_batch.assert_not_called()
+        mock_analyzer.analyze_pr.assert_not_awaited()
+        _, status, progress, message = mock_db.update_status.await_args_list[-1][0]
+        assert status == TaskStatus.PROCESSING
+        assert progress is None
+        assert message.startswith("Awaiting GitHub rate limit reset")
+
+
+class TestEnsureRateBudget:
+    """Test the rate limit budget check."""
+
+    @pytest.mark.parametrize("remaining", [None, 5, 10])
+    def test_enough_budget(self, remaining):
+        """Test no wait when the budget is unknown or sufficient."""
+        assert _ensure_rate_budget(remaining, None, 5) is None
+
+    def test_waits_at_least_a_minute(self):
+        """Test an imminent reset still waits the minimum countdown."""
+        reset = datetime.now() + timedelta(seconds=5)
+        assert _ensure_rate_budget(0, reset, 5) == 60
+
+    def test_need_beyond_window_fails_fast(self):
+        """Test a need larger than a whole window raises instead of retrying."""
+        reset = datetime.now() + timedelta(minutes=30)
+        with pytest.raises(RateLimitExceededException) as exc_info:
+            _ensure_rate_budget(10, reset, 100, limit=60)
+
+        assert exc_info.value.details == {"needed": 100, "limit": 60}
+
+
+def mock_db_manager(session):
+    """Database manager whose sessions all yield the given session."""
+    db_manager = Mock(_initialized=True)
+    db_manager.get_session.return_value.__aenter__ = AsyncMock(return_value=session)
+    db_manager.get_session.return_value.__aexit__ = AsyncMock(return_value=None)
+    return db_manager
+
+
+class TestUpdateTaskStatus:
+    """Test task status updates."""
+
+    @staticmethod
+    async def run_update(*args, rowcount=1):
+        """Run update_task_status and return the UPDATE it executed."""
+        session = Mock(
+            execute=AsyncMock(return_value=Mock(rowcount=rowcount)),
+            commit=AsyncMock(),
+        )
+
+        with patch(
+            "app.tasks.analyze_tasks.get_database_manager",
+            return_value=mock_db_manager(session),
+        ):
+            await update_task_status(uuid4(), *args)
+
+        session.commit.assert_awaited_once()
+        return session.execute.await_args[0][0]
+
+    @pytest.mark.parametrize(
+        "status,assignment",
+        [
+            (
+                TaskStatus.PROCESSING,
+                "started_at=coalesce(analysis_tasks.started_at, now())",
+            ),
+            (TaskStatus.COMPLETED, "completed_at=now()"),
+            (TaskStatus.FAILED, "completed_at=now()"),
+        ],
+    )
+    @pytest.mark.asyncio
+    async def test_timestamps_use_database_clock(self, status, assignment):
+        """Test lifecycle timestamps are set in one UPDATE with now()."""
+        stmt = await self.run_update(status, 50.0)
+
+        assert str(stmt).startswith("UPDATE analysis_tasks SET")
+        assert assignment in str(stmt)
+
+    @pytest.mark.asyncio
+    async def test_progress_update_keeps_timestamps(self):
+        """Test progress updates on a started task leave timestamps alone."""
+        stmt = await self.run_update(TaskStatus.PROCESSING, 80.0)
+
+        assert stmt.compile().params["progress"] == 80.0
+        assert "completed_at" not in str(stmt)
+
+    @pytest.mark.asyncio
+    async def test_failure_records_error_message(self):
+        """Test a failure message is stored as the task's error."""
+        stmt = await self.run_update(TaskStatus.FAILED, 0.0, "boom")
+
+        assert stmt.compile().params["error_message"] == "boom"
+
+    @pytest.mark.asyncio
+    async def test_waiting_note_keeps_progress(self):
+        """Test a running task's note is stored without touching its progress."""
+        stmt = await self.run_update(TaskStatus.PROCESSING, None, "Awaiting reset")
+
+        params = stmt.compile().params
+        assert params["error_message"] == "Awaiting reset"
+        assert "progress" not in params
+
+    @pytest.mark.asyncio
+    async def test_update_without_message_clears_note(self):
+        """Test a later status update clears an earlier waiting note."""
+        stmt = await self.run_update(TaskStatus.PROCESSING, 0.0)
+
+        assert stmt.compile().params["error_message"] is None
+
+    @pytest.mark.asyncio
+    async def test_failure_deletes_partial_results(self):
+        """Test failing a task deletes its results in the same transaction."""
+        session = Mock(
+            execute=AsyncMock(return_value=Mock(rowcount=1)), commit=AsyncMock()
+        )
+
+        with patch(
+            "app.tasks.analyze_tasks.get_database_manager",
+            return_value=mock_db_manager(session),
+        ):
+            await update_task_status(uuid4(), TaskStatus.FAILED, 0.0, "boom")
+
+        statements = [str(call.args[0]) for call in session.execute.await_args_list]
+        assert statements[0].startswith("DELETE FROM analysis_results")
+        assert statements[1].startswith("UPDATE analysis_tasks")
+        session.commit.assert_awaited_once()
+
+
+class TestFileResultWriter:
+    """Test incremental persistence of file results."""
+
+    @pytest.mark.asyncio
+    async def test_flushes_full_batches(self):
+        """Test results are written once a batch fills and the rest stay pending."""
+        session = Mock(execute=AsyncMock(), commit=AsyncMock())
+        writer = FileResultWriter(uuid4(), batch_size=2)
+
+        with patch(
+            "app.tasks.analyze_tasks.get_database_manager",
+            return_value=mock_db_manager(session),
+        ):
+            for name in ["a.py", "b.py", "c.py"]:
+                await writer.add(name, {"language": "python", "issues": []})
+
+        assert session.execute.await_count == 3
+        setting = str(session.execute.await_args_list[0][0][0])
+        assert setting == "SET LOCAL synchronous_commit = off"
+        # The first flush replaces rows left by an interrupted earlier run
+        cleared = str(session.execute.await_args_list[1][0][0])
+        assert cleared.startswith("DELETE FROM analysis_results")
+        rows = session.execute.await_args_list[2][0][1]
+        assert [row["file_path"] for row in rows] == ["a.py", "b.py"]
+        session.commit.assert_awaited_once()
+        assert list(writer.pending) == ["c.py"]
+        assert writer.cleared
+
+    @pytest.mark.asyncio
+    async def test_later_flushes_keep_earlier_batches(self):
+        """Test only the first flush deletes existing rows."""
+        session = Mock(execute=AsyncMock(), commit=AsyncMock())
+        writer = FileResultWriter(uuid4(), batch_size=1)
+
+        with patch(
+            "app.tasks.analyze_tasks.get_database_manager",
+            return_value=mock_db_manager(session),
+        ):
+            for name in ["a.py", "b.py"]:
+                await writer.add(name, {"language": "python", "issues": []})
+
+        statements = [str(call.args[0]) for call in session.execute.await_args_list]
+        assert sum(sql.startswith("DELETE") for sql in statements) == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_flushes_clear_once_before_writing(self):
+        """Test parallel flushes never delete a batch another flush committed."""
+        log = []
+
+        async def execute(stmt, *args):
+            await asyncio.sleep(0)
+            log.append(str(stmt).split(" ")[0])
+
+        async def commit():
+            await asyncio.sleep(0)
+            log.append("COMMIT")
+
+        session = Mock(execute=execute, commit=commit)
+        writer = FileResultWriter(uuid4(), batch_size=1)
+
+        with patch(
+            "app.tasks.analyze_tasks.get_database_manager",
+            return_value=mock_db_manager(session),
+        ):
+            await asyncio.gather(
+                writer.add("a.py", {"language": "python", "issues": []}),
+                writer.add("b.py", {"language": "python", "issues": []}),
+            )
+
+        assert log == [
+            "SET",
+            "DELETE",
+            "INSERT",
+            "COMMIT",
+            "SET",
+            "INSERT",
+            "COMMIT",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_flush_without_results_skips_database(self):
+        """Test an empty flush opens no session."""
+        db_manager = Mock()
+        writer = FileResultWriter(uuid4())
+
+        with patch(
+            "app.tasks.analyze_tasks.get_database_manager", return_value=db_manager
+        ):
+            await writer.flush()
+
+        db_manager.get_session.assert_not_called()
+
+
+class TestSummaryFields:
+    """Test mapping of workflow summaries onto AnalysisSummary columns."""
+
+    def test_breakdowns_fill_missing_counts(self):
+        """Test counts fall back to the breakdowns and legacy keys."""
+        fields = _summary_fields(
+            {
+                "total_files_analyzed": 3,
+                "total_issues": 4,
+                "severity_breakdown": {"critical": 1, "low": 3},
+                "issue_type_breakdown": {"bug": 2, "style": 2},
+                "overall_score": 7.5,
+            }
+        )
+
+        assert fields["total_files"] == 3
+        assert fields["total_issues"] == 4
+        assert fields["critical_issues"] == 1
+        assert fields["high_issues"] == 0
+        assert fields["low_issues"] == 3
+        assert fields["bug_issues"] == 2
+        assert fields["security_issues"] == 0
+        assert fields["code_quality_score"] == 7.5
+        assert fields["maintainability_score"] == 0.0
+
+    def test_explicit_values_win(self):
+        """Test explicit summary columns override the breakdowns."""
+        fields = _summary_fields(
+            {
+                "total_files": 5,
+                "total_files_analyzed": 3,
+                "critical_issues": 9,
+                "severity_breakdown": {"critical": 1},
+            }
+        )
+
+        assert fields["total_files"] == 5
+        assert fields["critical_issues"] == 9
+
+    def test_fields_are_summary_columns(self):
+        """Test every produced key is an AnalysisSummary column."""
+        columns = set(AnalysisSummary.model_fields) - {"id", "task_id"}
+        assert set(_summary_fields({})) <= columns
+
+
+class TestSaveAnalysisResults:
+    """Test persisting analysis results."""
+
+    @pytest.mark.asyncio
+    async def test_file_rows_are_bulk_inserted(self):
+        """Test file rows are bulk-inserted and the task completed in one commit."""
+        session = Mock()
+        session.execute = AsyncMock()
+        session.commit = AsyncMock()
+        db_manager = mock_db_manager(session)
+        task_id = uuid4()
+        results = {
+            "summary": {"total_issues": 0},
+            "files": {
+                "app/a.py": {"language": "python", "size": 10, "issues": []},
+                "app/b.py": {"language": "python", "size": 20, "issues": []},
+            },
+        }
+
+        with patch(
+            "app.tasks.analyze_tasks.get_database_manager", return_value=db_manager
+        ):
+            await save_analysis_results(task_id, results, {})
+
+        # Clearing earlier rows, one bulk insert for the files, one update
+        # completing the task; the commit stays synchronous so the completion
+        # is durable
+        statements = [str(call[0][0]) for call in session.execute.await_args_list]
+        assert len(statements) == 3
+        assert "synchronous_commit" not in " ".join(statements)
+        cleared = statements[0]
+        assert cleared.startswith("DELETE FROM analysis_results")
+        rows = session.execute.await_args_list[1][0][1]
+        assert [row["file_path"] for row in rows] == ["app/a.py", "app/b.py"]
+        assert rows[0]["file_name"] == "a.py"
+        assert all(row["task_id"] == task_id and row["id"] for row in rows)
+        session.add.assert_called_once()  # summary only
+        assert statements[2].startswith("UPDATE analysis_tasks")
+        db_manager.get_session.assert_called_once()
+        session.commit.assert_awaited_once()
+
+
+class TestRunAsyncInCelery:
+    """Test the worker event loop runner."""
+
+    def test_loop_is_reused_with_named_executor(self):
+        """Test coroutines share one loop whose executor threads are named."""
+
+        async def worker_thread_name():
+            return await asyncio.to_thread(lambda: threading.current_thread().name)
+
+        async def current_loop():
+            return asyncio.get_running_loop()
+
+        with patch.object(analyze_tasks, "_worker_loop", None):
+            try:
+                assert run_async_in_celery(worker_thread_name()).startswith(
+                    "celery-async"
+                )
+                loop = analyze_tasks._worker_loop
+                assert run_async_in_celery(current_loop()) is loop
+            finally:
+                analyze_tasks._worker_loop.close()
+                asyncio.set_event_loop(None)
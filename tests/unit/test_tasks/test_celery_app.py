@@ -0,0 +1,27 @@
+"""Tests for Celery application configuration."""
+
+from kombu.serialization import dumps, loads
+
+from app.tasks.celery_app import celery
+
+
+class TestOrjsonSerializer:
+    """Test the orjson message serializer."""
+
+    def test_tasks_and_results_use_orjson(self):
+        """Test task messages and results are serialized with orjson."""
+        assert celery.conf.task_serializer == "orjson"
+        assert celery.conf.result_serializer == "orjson"
+        assert "json" in celery.conf.accept_content
+
+    def test_round_trip(self):
+        """Test a task result survives encoding and decoding."""
+        result = {"status": "completed", "files_analyzed": 3, "summary": {1: "x"}}
+
+        content_type, encoding, body = dumps(result, serializer="orjson")
+
+        assert loads(body, content_type, encoding, accept=[content_type]) == {
+            "status": "completed",
+            "files_analyzed": 3,
+            "summary": {"1": "x"},
+        }
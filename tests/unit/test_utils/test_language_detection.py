@@ -1,7 +1,7 @@
 """Tests for language detection utility."""
 
 import pytest
-from app.utils.language_detection import LanguageDetector
+from app.utils.language_detection import MAX_SCAN_CHARS, LanguageDetector
 
 
 class TestLanguageDetector:
@@ -215,6 +215,15 @@ class TestLanguageDetector:
             f"Failed for content: {content[:30]}..., expected None, got {language}"
         )
 
+    def test_content_scan_is_bounded(self):
+        """Test only the start of large content is scanned for signatures."""
+        padding = "plain text\n" * (MAX_SCAN_CHARS // 10)
+
+        assert self.detector.detect_language_from_content(padding + "def f():") is None
+        assert self.detector.detect_language_from_content("def f():\n" + padding) == (
+            "python"
+        )
+
     def test_filename_override_content(self):
         """Test that filename detection takes precedence over content."""
         # Content looks like JavaScript but filename is Python
@@ -246,6 +255,25 @@ class TestLanguageDetector:
         language = self.detector.detect_language_from_filename(path)
         assert language == expected, f"Failed for {path}"
 
+    def test_filename_lookup_is_memoized(self):
+        """Test repeated basenames are served from the lookup cache."""
+        LanguageDetector._detect_language_from_basename.cache_clear()
+
+        assert self.detector.detect_language_from_filename("src/a/main.py") == "python"
+        assert self.detector.detect_language_from_filename("src/b/MAIN.PY") == "python"
+
+        cache_info = LanguageDetector._detect_language_from_basename.cache_info()
+        assert cache_info.misses == 1
+        assert cache_info.hits == 1
+
+    @pytest.mark.parametrize(
+        "language,expected",
+        [("python", True), ("Python", True), ("markdown", False), (None, False)],
+    )
+    def test_is_supported_language(self, language, expected):
+        """Test supported languages are matched case-insensitively."""
+        assert self.detector.is_supported_language(language) is expected
+
     @pytest.mark.parametrize(
         "filename",
         [
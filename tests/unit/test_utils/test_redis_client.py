@@ -0,0 +1,32 @@
+"""Tests for shared Redis clients."""
+
+import pytest
+
+from app.utils import redis_client
+from app.utils.redis_client import (
+    close_redis_clients,
+    get_async_redis_client,
+    get_sync_redis_client,
+)
+
+
+class TestRedisClients:
+    """Test Redis client reuse."""
+
+    def test_sync_client_is_shared(self):
+        """Test every caller gets the same synchronous client."""
+        assert get_sync_redis_client() is get_sync_redis_client()
+
+    @pytest.mark.asyncio
+    async def test_async_client_is_shared_until_closed(self):
+        """Test the async client is reused and recreated after closing."""
+        client = await get_async_redis_client()
+
+        assert await get_async_redis_client() is client
+
+        await close_redis_clients()
+
+        assert redis_client._async_client is None
+        assert get_sync_redis_client.cache_info().currsize == 0
+        assert await get_async_redis_client() is not client
+        await close_redis_clients()